@@ -0,0 +1,10 @@
+"""Pytest configuration for the repository root."""
+
+# Manual check scripts kept at the root; they build Textual apps or import
+# the UI at module level and contain no tests, so don't collect them.
+collect_ignore = [
+    "test_import.py",
+    "test_official.py",
+    "test_simple.py",
+    "test_textual.py",
+]
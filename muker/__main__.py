@@ -22,6 +22,15 @@ def debug_print(*args, **kwargs):
 import builtins
 builtins.print = debug_print
 
+# Hot-path diagnostics go through logging so they cost nothing unless enabled,
+# e.g. MUKER_LOG_LEVEL=DEBUG. Log records only go to the file, never the terminal.
+import logging
+logging.basicConfig(
+    stream=debug_file,
+    level=os.environ.get('MUKER_LOG_LEVEL', 'WARNING').upper(),
+    format='[%(levelname)s] %(name)s: %(message)s'
+)
+
 print("[DEBUG] Environment configured for Windows terminal support")
 print("[DEBUG] Debug output will be saved to muker_debug.log")
 
@@ -1,7 +1,9 @@
 """Main Textual application for Muker music player."""
 
 import asyncio
+import logging
 from pathlib import Path
+import numpy as np
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.widgets import Header, Footer
@@ -10,11 +12,14 @@ from textual.widgets import Header, Footer
 from muker.core.player import AudioPlayer
 from muker.core.playlist import PlaylistManager
 from muker.core.library import MusicLibrary
-from muker.core.visualizer import AudioVisualizer
+from muker.core.visualizer import AudioVisualizer, warm_up_kernels
 from muker.utils.config import Config
+from muker.ui.messages import UITick, UI_TICK_TARGETS
 
 print("[DEBUG] app.py imports completed successfully")
 
+log = logging.getLogger(__name__)
+
 
 class MukerApp(App):
     """Muker CLI Music Player Application."""
@@ -117,7 +122,7 @@ class MukerApp(App):
                 if VisualizerWidget:
                     print("[DEBUG] Creating VisualizerWidget...")
                     try:
-                        yield VisualizerWidget(self.visualizer)
+                        yield VisualizerWidget(self.visualizer, fps=self.config.get('visualizer_fps', 30))
                         print("[DEBUG] VisualizerWidget created")
                     except Exception as e:
                         print(f"[ERROR] Failed to create VisualizerWidget: {e}")
@@ -262,21 +267,41 @@ class MukerApp(App):
         volume = self.config.get('volume', 0.7)
         self.player.set_volume(volume)
 
+        # Compile the visualizer kernels in the background, before the first frame
+        self._warm_up_task = asyncio.create_task(asyncio.to_thread(warm_up_kernels))
+
         # Start PCM processing task
         self.pcm_task = asyncio.create_task(self._process_pcm_data())
 
+        # One shared timer drives the periodic widget updates
+        self._ui_tick_count = 0
+        self.set_interval(0.064, self._post_ui_tick)
+
+    def _post_ui_tick(self):
+        """Send a UITick to every widget that updates periodically.
+
+        Every screen on the stack is searched, not just the active one, so
+        the player widgets keep updating underneath a modal popup.
+        """
+        self._ui_tick_count += 1
+        for screen in self.screen_stack:
+            for widget in screen.query(UI_TICK_TARGETS):
+                widget.post_message(UITick(self._ui_tick_count))
+
     async def on_key(self, event) -> None:
         """Handle key press events."""
-        print(f"[DEBUG] Key pressed: {event.key}")
+        log.debug("Key pressed: %s", event.key)
         # Let the default handler process it
 
     async def _process_pcm_data(self):
         """Background task to process PCM data for visualizer."""
+        # One snapshot buffer reused for every frame
+        pcm_buffer = np.empty_like(self.player.pcm_buffer)
         while True:
             try:
                 if self.player.is_playing:
                     # Get PCM data from player
-                    pcm_data = await asyncio.to_thread(self.player.get_pcm_data)
+                    pcm_data = await asyncio.to_thread(self.player.get_pcm_data, pcm_buffer)
 
                     # Process with visualizer
                     self.visualizer.process_audio(pcm_data)
@@ -309,21 +334,13 @@ class MukerApp(App):
             return
 
         try:
-            # Import SpotifyService
-            from muker.services.spotify_service import SpotifyService
-            from muker.utils.file_scanner import FileScanner
+            from muker.services.spotify_service import get_spotify_service
 
-            # Get Spotify service instance
-            spotify_service = FileScanner._spotify_service
-            if not spotify_service:
-                return
+            # Get shared Spotify service instance
+            spotify_service = get_spotify_service()
 
             # Fetch lyrics in background
-            await asyncio.to_thread(
-                spotify_service.enrich_track_with_lyrics,
-                track,
-                format="lrc"
-            )
+            await spotify_service.enrich_track_with_lyrics_async(track, format="lrc")
         except Exception as e:
             print(f"[WARNING] Failed to fetch lyrics: {e}")
 
@@ -404,17 +421,24 @@ class MukerApp(App):
             await self.player.load_track(prev_track)
             await self.player.play()
 
+    def _remember_volume(self):
+        """Persist the volume; key repeats are coalesced into one write."""
+        self.config.set('volume', self.player.get_volume())
+        self.config.save_later()
+
     def action_volume_up(self):
         """Increase volume."""
         current_volume = self.player.get_volume()
         new_volume = min(1.0, current_volume + 0.05)
         self.player.set_volume(new_volume)
+        self._remember_volume()
 
     def action_volume_down(self):
         """Decrease volume."""
         current_volume = self.player.get_volume()
         new_volume = max(0.0, current_volume - 0.05)
         self.player.set_volume(new_volume)
+        self._remember_volume()
 
     def action_toggle_shuffle(self):
         """Toggle shuffle mode."""
@@ -445,32 +469,15 @@ class MukerApp(App):
         if not music_dir.exists():
             music_dir = Path.home()
 
-        print(f"[DEBUG] Music folder exists: {music_dir.exists()}")
-        print(f"[DEBUG] Music folder path: {music_dir}")
-
-        # List files in the directory for debugging
-        if music_dir.exists():
-            try:
-                files = list(music_dir.glob("*.mp3"))
-                print(f"[DEBUG] Found {len(files)} MP3 files in {music_dir}")
-                if files:
-                    for f in files[:5]:  # Show first 5
-                        print(f"[DEBUG]   - {f.name}")
-            except Exception as e:
-                print(f"[DEBUG] Error listing files: {e}")
+        log.debug("Music folder path: %s (exists: %s)", music_dir, music_dir.exists())
 
         try:
             self.notify(f"Scanning {music_dir}...", timeout=2)
-            print(f"[DEBUG] Starting scan of directory: {music_dir}")
-
-            # Scan directory for music files
-            tracks = await self.library.scan_directory(music_dir, recursive=True)
-            print(f"[DEBUG] Found {len(tracks)} tracks")
+            log.debug("Starting scan of directory: %s", music_dir)
 
-            # Add tracks to playlist
-            self.playlist.clear()
-            self.playlist.add_tracks(tracks)
-            print(f"[DEBUG] Added {len(tracks)} tracks to playlist")
+            # Tracks show up in the playlist as they are found
+            tracks = await self.library.scan_into_playlist(music_dir, self.playlist)
+            log.debug("Loaded %d tracks into playlist", len(tracks))
 
             self.notify(f"Loaded {len(tracks)} tracks", severity="information", timeout=3)
 
@@ -478,22 +485,22 @@ class MukerApp(App):
             try:
                 playlist_view = self.query_one(PlaylistView)
                 if playlist_view:
-                    print("[DEBUG] Forcing playlist view update")
-                    playlist_view.update_playlist()
+                    log.debug("Forcing playlist view update")
+                    playlist_view.check_updates()
             except Exception as ex:
-                print(f"[DEBUG] Could not update playlist view: {ex}")
+                log.debug("Could not update playlist view: %s", ex)
 
-            # Start playing first track if available
+            # Start playing the current track unless it is already playing
             if tracks:
                 first_track = self.playlist.get_current_track()
-                print(f"[DEBUG] First track: {first_track.title if first_track else 'None'}")
-                if first_track:
-                    print(f"[DEBUG] Loading first track: {first_track.file_path}")
+                log.debug("First track: %s", first_track.title if first_track else None)
+                if first_track and not self.player.is_playing_file(first_track.file_path):
+                    log.debug("Loading first track: %s", first_track.file_path)
                     await self._fetch_lyrics_for_track(first_track)
                     await self.player.load_track(first_track)
                     await self.player.play()
             else:
-                print("[DEBUG] No tracks to play")
+                log.debug("No tracks to play")
         except Exception as e:
             # Handle error (would show error dialog in full implementation)
             import traceback
@@ -3,12 +3,32 @@
 import sqlite3
 import json
 import os
+import threading
+import zlib
 from pathlib import Path
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, Iterable, List, Tuple
+
+try:
+    import zstandard as zstd
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Magic number at the start of every zstd frame
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
 
 class DatabaseManager:
     """Manages SQLite database for caching."""
 
+    # Lyrics lookups run on every track change; keeping the SQL text constant
+    # lets sqlite3's per-connection statement cache reuse the prepared statement
+    _GET_LYRICS_SQL = "SELECT lyrics_json FROM spotify_lyrics_cache WHERE spotify_id = ?"
+    _GET_LYRICS_ENTRY_SQL = """
+        SELECT lyrics_json, etag,
+               (julianday('now') - julianday(last_updated)) * 86400
+        FROM spotify_lyrics_cache WHERE spotify_id = ?
+    """
+
     def __init__(self, db_path: Optional[Path] = None):
         """Initialize database connection.
 
@@ -21,13 +41,28 @@ class DatabaseManager:
             self.db_path = db_path
             
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Lyrics payloads are stored compressed; zlib is used when zstandard is missing
+        if ZSTD_AVAILABLE:
+            self._zc = zstd.ZstdCompressor(level=3)
+            self._zd = zstd.ZstdDecompressor()
+
+        # One connection per manager, shared by the worker threads that use it
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+
         self._init_db()
 
     def _init_db(self):
         """Initialize database tables."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._lock, self._conn as conn:
                 cursor = conn.cursor()
+
+                # WAL lets the UI read the cache while a fetch is writing to it,
+                # and with WAL, synchronous=NORMAL is still safe against corruption
+                cursor.execute("PRAGMA journal_mode=WAL")
+                cursor.execute("PRAGMA synchronous=NORMAL")
                 
                 # Genius cache table
                 cursor.execute("""
@@ -46,14 +81,54 @@ class DatabaseManager:
                     CREATE TABLE IF NOT EXISTS spotify_lyrics_cache (
                         spotify_id TEXT PRIMARY KEY,
                         lyrics_json TEXT,
+                        etag TEXT,
                         last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                     )
                 """)
+
+                # Tag metadata of local files, valid while mtime and size match
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS file_metadata_cache (
+                        path TEXT PRIMARY KEY,
+                        mtime_ns INTEGER,
+                        size INTEGER,
+                        metadata_json TEXT
+                    )
+                """)
+
+                # Caches created before ETag support lack the etag column
+                cursor.execute("PRAGMA table_info(spotify_lyrics_cache)")
+                columns = {row[1] for row in cursor.fetchall()}
+                if 'etag' not in columns:
+                    cursor.execute("ALTER TABLE spotify_lyrics_cache ADD COLUMN etag TEXT")
                 
                 conn.commit()
         except sqlite3.Error as e:
             print(f"[ERROR] Database initialization failed: {e}")
 
+    def _compress_json(self, data: Any) -> bytes:
+        """Serialize data to JSON and compress it for storage."""
+        raw = json.dumps(data).encode('utf-8')
+        if ZSTD_AVAILABLE:
+            return self._zc.compress(raw)
+        return zlib.compress(raw)
+
+    def _decompress_json(self, payload: Any) -> Optional[Any]:
+        """Decode a stored payload written by _compress_json.
+
+        Plain JSON text from older caches is still accepted.
+        """
+        if isinstance(payload, str):
+            return json.loads(payload)
+
+        payload = bytes(payload)
+        if payload.startswith(ZSTD_MAGIC):
+            if not ZSTD_AVAILABLE:
+                # Written by an install with zstandard; treat as a cache miss
+                return None
+            return json.loads(self._zd.decompress(payload))
+        return json.loads(zlib.decompress(payload))
+
     def _get_query_key(self, artist: str, title: str) -> str:
         """Generate normalized query key."""
         return f"{artist.lower().strip()}|{title.lower().strip()}"
@@ -66,7 +141,7 @@ class DatabaseManager:
         """
         key = self._get_query_key(artist, title)
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._lock, self._conn as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     "SELECT genius_id, primary_color, secondary_color, annotations_json FROM genius_cache WHERE query_key = ?",
@@ -90,7 +165,7 @@ class DatabaseManager:
         """Save Genius data to cache."""
         key = self._get_query_key(artist, title)
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._lock, self._conn as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     """
@@ -107,33 +182,120 @@ class DatabaseManager:
     def get_spotify_lyrics(self, spotify_id: str) -> Optional[Dict[str, Any]]:
         """Get cached Spotify lyrics."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._lock, self._conn as conn:
                 cursor = conn.cursor()
-                cursor.execute(
-                    "SELECT lyrics_json FROM spotify_lyrics_cache WHERE spotify_id = ?",
-                    (spotify_id,)
-                )
+                cursor.execute(self._GET_LYRICS_SQL, (spotify_id,))
                 row = cursor.fetchone()
                 
                 if row and row[0]:
-                    return json.loads(row[0])
+                    return self._decompress_json(row[0])
         except Exception as e:
             print(f"[ERROR] Failed to get lyrics from cache: {e}")
         return None
 
-    def save_spotify_lyrics(self, spotify_id: str, lyrics: dict):
+    def get_spotify_lyrics_entry(self, spotify_id: str) -> Optional[Dict[str, Any]]:
+        """Get cached Spotify lyrics together with revalidation info.
+
+        Returns:
+            Dict with lyrics, etag and age (seconds since last fetch or
+            revalidation), or None if not found
+        """
+        try:
+            with self._lock, self._conn as conn:
+                cursor = conn.cursor()
+                cursor.execute(self._GET_LYRICS_ENTRY_SQL, (spotify_id,))
+                row = cursor.fetchone()
+
+                if row and row[0]:
+                    lyrics = self._decompress_json(row[0])
+                    if lyrics is None:
+                        return None
+                    return {
+                        'lyrics': lyrics,
+                        'etag': row[1],
+                        'age': row[2] or 0.0
+                    }
+        except Exception as e:
+            print(f"[ERROR] Failed to get lyrics from cache: {e}")
+        return None
+
+    def save_spotify_lyrics(self, spotify_id: str, lyrics: dict, etag: Optional[str] = None):
         """Save Spotify lyrics to cache."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._lock, self._conn as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     """
                     INSERT OR REPLACE INTO spotify_lyrics_cache 
-                    (spotify_id, lyrics_json)
-                    VALUES (?, ?)
+                    (spotify_id, lyrics_json, etag)
+                    VALUES (?, ?, ?)
                     """,
-                    (spotify_id, json.dumps(lyrics))
+                    (spotify_id, self._compress_json(lyrics), etag)
                 )
                 conn.commit()
         except Exception as e:
             print(f"[ERROR] Failed to save lyrics to cache: {e}")
+
+    def touch_spotify_lyrics(self, spotify_id: str):
+        """Mark cached Spotify lyrics as freshly revalidated."""
+        try:
+            with self._lock, self._conn as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "UPDATE spotify_lyrics_cache SET last_updated = CURRENT_TIMESTAMP WHERE spotify_id = ?",
+                    (spotify_id,)
+                )
+                conn.commit()
+        except Exception as e:
+            print(f"[ERROR] Failed to update lyrics cache timestamp: {e}")
+
+    def get_file_metadata(self, paths: List[str]) -> Dict[str, Tuple[int, int, Dict[str, Any]]]:
+        """Get cached tag metadata for local files.
+
+        Args:
+            paths: File paths to look up
+
+        Returns:
+            Dict mapping path to (mtime_ns, size, metadata) for cached files
+        """
+        found: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+        if not paths:
+            return found
+        try:
+            with self._lock, self._conn as conn:
+                cursor = conn.cursor()
+                # Stay well below SQLite's bound-parameter limit
+                for start in range(0, len(paths), 500):
+                    chunk = paths[start:start + 500]
+                    cursor.execute(
+                        "SELECT path, mtime_ns, size, metadata_json FROM file_metadata_cache "
+                        f"WHERE path IN ({','.join('?' * len(chunk))})",
+                        chunk
+                    )
+                    for path, mtime_ns, size, metadata_json in cursor.fetchall():
+                        found[path] = (mtime_ns, size, json.loads(metadata_json))
+        except Exception as e:
+            print(f"[ERROR] Failed to get file metadata from cache: {e}")
+        return found
+
+    def save_file_metadata(self, entries: Iterable[Tuple[str, int, int, Dict[str, Any]]]):
+        """Save tag metadata for local files in a single transaction.
+
+        Args:
+            entries: (path, mtime_ns, size, metadata) tuples
+        """
+        try:
+            with self._lock, self._conn as conn:
+                conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO file_metadata_cache
+                    (path, mtime_ns, size, metadata_json)
+                    VALUES (?, ?, ?, ?)
+                    """,
+                    [
+                        (path, mtime_ns, size, json.dumps(metadata))
+                        for path, mtime_ns, size, metadata in entries
+                    ]
+                )
+        except Exception as e:
+            print(f"[ERROR] Failed to save file metadata to cache: {e}")
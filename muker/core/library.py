@@ -1,8 +1,10 @@
 """Music library management module."""
 
+import asyncio
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, Optional
 from muker.models.track import Track
+from muker.core.playlist import PlaylistManager
 from muker.utils.file_scanner import FileScanner
 
 
@@ -19,40 +21,99 @@ class MusicLibrary:
         self.current_directory: Optional[Path] = None
         self.spotify_enabled = False
 
-        # Initialize Spotify service if enabled
-        if enable_spotify:
-            try:
-                from muker.services.spotify_service import SpotifyService
-                spotify_service = SpotifyService()
-                if spotify_service.is_available():
-                    FileScanner.set_spotify_service(spotify_service)
-                    self.spotify_enabled = True
-                    print("[INFO] Spotify metadata enrichment enabled")
-                else:
-                    print("[INFO] Spotify not available - using local metadata only")
-            except ImportError:
-                print("[INFO] Spotipy not installed - using local metadata only")
-            except Exception as e:
-                print(f"[WARNING] Failed to initialize Spotify service: {e}")
-
-    async def scan_directory(self, directory: Path, recursive: bool = True) -> List[Track]:
+        # Spotify service is set up on the first scan, not at startup
+        self._enable_spotify = enable_spotify
+        self._spotify_initialized = False
+        self._metadata_cache_initialized = False
+
+    def _init_spotify(self):
+        """Initialize Spotify metadata enrichment if enabled."""
+        if self._spotify_initialized:
+            return
+        self._spotify_initialized = True
+
+        if not self._enable_spotify:
+            return
+
+        try:
+            from muker.services.spotify_service import get_spotify_service
+            spotify_service = get_spotify_service()
+            if spotify_service.is_available():
+                FileScanner.set_spotify_service(spotify_service)
+                self.spotify_enabled = True
+                print("[INFO] Spotify metadata enrichment enabled")
+            else:
+                print("[INFO] Spotify not available - using local metadata only")
+        except ImportError:
+            print("[INFO] Spotipy not installed - using local metadata only")
+        except Exception as e:
+            print(f"[WARNING] Failed to initialize Spotify service: {e}")
+
+    def _init_metadata_cache(self):
+        """Open the metadata cache used to skip re-parsing unchanged files."""
+        self._metadata_cache_initialized = True
+        try:
+            from muker.core.database import DatabaseManager
+            FileScanner.set_metadata_cache(DatabaseManager())
+        except Exception as e:
+            print(f"[WARNING] Failed to open metadata cache: {e}")
+
+    async def scan_directory(self, directory: Path, recursive: bool = True,
+                             on_batch: Optional[Callable[[List[Track]], None]] = None) -> List[Track]:
         """Scan a directory for music files.
 
         Args:
             directory: Directory to scan
             recursive: Whether to scan subdirectories
+            on_batch: Called with each batch of unsorted tracks as it is read
 
         Returns:
             List of found tracks
         """
         self.current_directory = directory
+        if not self._spotify_initialized:
+            await asyncio.to_thread(self._init_spotify)
+        if not self._metadata_cache_initialized:
+            await asyncio.to_thread(self._init_metadata_cache)
         self.tracks = await FileScanner.scan_directory(
             directory,
             recursive,
-            enrich_with_spotify=self.spotify_enabled
+            enrich_with_spotify=self.spotify_enabled,
+            on_batch=on_batch
         )
         return self.tracks
 
+    async def scan_into_playlist(self, directory: Path, playlist: PlaylistManager,
+                                 recursive: bool = True) -> List[Track]:
+        """Scan a directory and load the result into a playlist.
+
+        Tracks are added to the playlist as they are found so the list fills
+        up during the scan; track change callbacks are held back until the
+        final sorted list is in place. A track the user selected during the
+        scan, or else the track that was current before it, stays current
+        (matched by path) if it is part of the result.
+
+        Args:
+            directory: Directory to scan
+            playlist: Playlist whose tracks are replaced
+            recursive: Whether to scan subdirectories
+
+        Returns:
+            List of found tracks, sorted
+        """
+        previous = playlist.get_current_track()
+        with playlist.hold_notifications():
+            playlist.clear()
+            tracks = await self.scan_directory(directory, recursive, on_batch=playlist.add_tracks)
+
+            # While streaming, the first track found is current by default;
+            # anything else was picked by the user
+            current = playlist.get_current_track()
+            if current is not None and current is not playlist.tracks[0]:
+                previous = current
+            playlist.replace_tracks(tracks, keep_path=previous.file_path if previous else None)
+        return tracks
+
     def get_tracks(self) -> List[Track]:
         """Get all tracks in the library.
 
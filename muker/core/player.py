@@ -10,6 +10,7 @@ import pygame.mixer
 import time
 
 from muker.models.track import Track
+from muker.utils.audio_utils import stereo_to_mono
 
 
 class AudioPlayer:
@@ -172,13 +173,13 @@ class AudioPlayer:
                                 chunk = samples[sample_pos:end_pos]
 
                                 with self.pcm_lock:
+                                    # Downmix straight into the fixed buffer
+                                    chunk_len = min(len(chunk), self.buffer_size)
+                                    target = self.pcm_buffer[:chunk_len]
                                     if chunk.ndim == 2:
-                                        mono = np.mean(chunk, axis=1)
+                                        stereo_to_mono(chunk[:chunk_len], out=target)
                                     else:
-                                        mono = chunk
-
-                                    chunk_len = min(len(mono), self.buffer_size)
-                                    self.pcm_buffer[:chunk_len] = mono[:chunk_len]
+                                        target[:] = chunk[:chunk_len]
                                     if chunk_len < self.buffer_size:
                                         self.pcm_buffer[chunk_len:] = 0
 
@@ -259,14 +260,33 @@ class AudioPlayer:
         """
         return self.volume
 
-    def get_pcm_data(self) -> np.ndarray:
+    def get_pcm_data(self, out: Optional[np.ndarray] = None) -> np.ndarray:
         """Get current PCM data for visualizer.
 
+        Args:
+            out: Optional float32 array of buffer_size samples to copy into,
+                so a polling caller can reuse one buffer
+
         Returns:
             PCM data array
         """
         with self.pcm_lock:
-            return self.pcm_buffer.copy()
+            if out is None:
+                return self.pcm_buffer.copy()
+            np.copyto(out, self.pcm_buffer)
+            return out
+
+    def is_playing_file(self, file_path: str) -> bool:
+        """Check whether the file at file_path is the one playing.
+
+        Args:
+            file_path: Audio file path
+
+        Returns:
+            True if that file is loaded and playing
+        """
+        return (self.is_playing and self.current_track is not None
+                and self.current_track.file_path == file_path)
 
     def get_position(self) -> float:
         """Get current playback position in seconds.
@@ -2,9 +2,10 @@
 
 import json
 import random
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Iterator, List, Optional
 import aiofiles
 
 from muker.models.track import Track
@@ -25,6 +26,76 @@ class PlaylistManager:
         self.shuffle_indices: List[int] = []
         self.shuffle_position: int = 0
 
+        # Callbacks invoked with the new current track whenever it changes
+        self._track_changed_callbacks: List[Callable[[Optional[Track]], None]] = []
+        self._notified_track: Optional[Track] = None
+        self._notify_holds = 0
+
+    def add_track_changed_callback(self, callback: Callable[[Optional[Track]], None]):
+        """Register a callback for current track changes.
+
+        Args:
+            callback: Called with the new current track (or None)
+        """
+        self._track_changed_callbacks.append(callback)
+
+    def remove_track_changed_callback(self, callback: Callable[[Optional[Track]], None]):
+        """Unregister a track change callback.
+
+        Args:
+            callback: Previously registered callback
+        """
+        if callback in self._track_changed_callbacks:
+            self._track_changed_callbacks.remove(callback)
+
+    def _notify_track_changed(self):
+        """Invoke track change callbacks if the current track changed."""
+        if self._notify_holds:
+            return
+        track = self.get_current_track()
+        if track is self._notified_track:
+            return
+        self._notified_track = track
+        for callback in list(self._track_changed_callbacks):
+            callback(track)
+
+    @contextmanager
+    def hold_notifications(self) -> Iterator[None]:
+        """Hold back track change callbacks until the block exits.
+
+        Callbacks then fire once if the current track ended up different,
+        so intermediate states (e.g. a list filling up during a scan) never
+        reach listeners.
+        """
+        self._notify_holds += 1
+        try:
+            yield
+        finally:
+            self._notify_holds -= 1
+            self._notify_track_changed()
+
+    def replace_tracks(self, tracks: List[Track], keep_path: Optional[str] = None):
+        """Replace all tracks in the playlist.
+
+        Args:
+            tracks: New tracks
+            keep_path: File path of a track to keep current if it is in the
+                new list; otherwise the first track becomes current
+        """
+        self.tracks[:] = tracks
+        self.current_index = 0
+        if keep_path is not None:
+            for index, track in enumerate(self.tracks):
+                if track.file_path == keep_path:
+                    self.current_index = index
+                    break
+        self.shuffle_position = 0
+        if self.shuffle_enabled:
+            self._shuffle_tracks()
+        else:
+            self.shuffle_indices.clear()
+        self._notify_track_changed()
+
     def add_track(self, track: Track):
         """Add a track to the playlist.
 
@@ -33,6 +104,7 @@ class PlaylistManager:
         """
         self.tracks.append(track)
         self._update_shuffle_indices()
+        self._notify_track_changed()
 
     def add_tracks(self, tracks: List[Track]):
         """Add multiple tracks to the playlist.
@@ -42,6 +114,7 @@ class PlaylistManager:
         """
         self.tracks.extend(tracks)
         self._update_shuffle_indices()
+        self._notify_track_changed()
 
     def remove_track(self, index: int):
         """Remove a track at the given index.
@@ -59,6 +132,7 @@ class PlaylistManager:
                 self.current_index = 0
 
             self._update_shuffle_indices()
+            self._notify_track_changed()
 
     def clear(self):
         """Clear all tracks from the playlist."""
@@ -66,6 +140,7 @@ class PlaylistManager:
         self.current_index = 0
         self.shuffle_indices.clear()
         self.shuffle_position = 0
+        self._notify_track_changed()
 
     def move_track(self, from_index: int, to_index: int):
         """Move a track from one position to another.
@@ -115,9 +190,12 @@ class PlaylistManager:
             return None
 
         if self.shuffle_enabled:
-            return self._next_shuffle()
+            track = self._next_shuffle()
         else:
-            return self._next_sequential()
+            track = self._next_sequential()
+
+        self._notify_track_changed()
+        return track
 
     def _next_sequential(self) -> Optional[Track]:
         """Get next track in sequential order."""
@@ -167,9 +245,12 @@ class PlaylistManager:
             return None
 
         if self.shuffle_enabled:
-            return self._previous_shuffle()
+            track = self._previous_shuffle()
         else:
-            return self._previous_sequential()
+            track = self._previous_sequential()
+
+        self._notify_track_changed()
+        return track
 
     def _previous_sequential(self) -> Optional[Track]:
         """Get previous track in sequential order."""
@@ -214,6 +295,8 @@ class PlaylistManager:
                 except ValueError:
                     pass
 
+            self._notify_track_changed()
+
     def toggle_shuffle(self) -> bool:
         """Toggle shuffle mode.
 
@@ -319,6 +402,8 @@ class PlaylistManager:
         if self.shuffle_enabled:
             self._shuffle_tracks()
 
+        self._notify_track_changed()
+
     def get_track_count(self) -> int:
         """Get number of tracks in playlist.
 
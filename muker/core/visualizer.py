@@ -2,9 +2,109 @@
 
 import numpy as np
 from enum import Enum
-from typing import Tuple
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 from muker.utils.audio_utils import stereo_to_mono, calculate_rms
 
+try:
+    import scipy.fft
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Number of bars kept in AudioVisualizer.spectrum_data
+SPECTRUM_BINS = 32
+
+# Number of points kept in AudioVisualizer.waveform_data
+WAVEFORM_SAMPLES = 100
+
+# Added to magnitudes to avoid log10(0); also the minimum usable range
+EPSILON = 1e-6
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, fastmath=True)
+    def _spectrum_levels(magnitude, half_size, starts, counts, out):
+        """Turn FFT magnitudes into bar levels in one compiled kernel.
+
+        Scales and log-compresses magnitude in place, takes the 5th/98th
+        percentile range, then averages each band (counts[b] bins from
+        starts[b]) and normalizes, clips and gamma-corrects it into out.
+        """
+        for i in range(magnitude.shape[0]):
+            magnitude[i] = np.log10(magnitude[i] / half_size + EPSILON)
+
+        bounds = np.percentile(magnitude, np.array([5.0, 98.0]))
+        min_val = bounds[0]
+        span = bounds[1] - bounds[0]
+
+        for b in range(starts.shape[0]):
+            if span < EPSILON:
+                out[b] = 0.0
+                continue
+            total = 0.0
+            for i in range(starts[b], starts[b] + int(counts[b])):
+                total += magnitude[i]
+            level = (total / counts[b] - min_val) / span
+            out[b] = np.sqrt(min(max(level, 0.0), 1.0))
+
+
+def _rfft(x: np.ndarray, n: int, workers: Optional[int] = None) -> np.ndarray:
+    """Real FFT along the last axis of x zero-padded to n, in x's precision.
+
+    Uses scipy.fft (which caches plans and can split a batch of rows
+    across workers threads) when available, else numpy.fft.
+    """
+    if SCIPY_AVAILABLE:
+        spectrum: np.ndarray = scipy.fft.rfft(x, n=n, workers=workers)
+        return spectrum
+    return np.fft.rfft(x, n=n)
+
+
+def _aligned_empty(size: int, dtype=np.float32, alignment: int = 64) -> np.ndarray:
+    """Uninitialized 1-D array whose data starts on an alignment-byte boundary.
+
+    np.empty only guarantees 16 bytes, which leaves wide SIMD loads
+    unaligned. The result is a view into a slightly larger allocation.
+    """
+    itemsize = np.dtype(dtype).itemsize
+    raw = np.empty(size + alignment // itemsize, dtype=dtype)
+    offset = (-raw.ctypes.data % alignment) // itemsize
+    return raw[offset:offset + size]
+
+
+@lru_cache(maxsize=8)
+def _hanning_window(size: int) -> np.ndarray:
+    """Hanning window in float32 like the audio, shared by all visualizers.
+
+    The array is read-only since every instance of that size holds it.
+    """
+    window = _aligned_empty(size)
+    window[:] = np.hanning(size)
+    window.setflags(write=False)
+    return window
+
+
+def warm_up_kernels():
+    """Compile (or load from cache) the Numba kernels used per frame.
+
+    The first call of each kernel pays its JIT/cache-load cost, a few
+    hundred milliseconds. Running this off the UI thread at startup keeps
+    that cost out of the first visualizer frame. No-op without Numba.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    stereo = np.zeros((64, 2), dtype=np.float32)
+    AudioVisualizer(fft_size=64).process_audio(stereo)
+    stereo_to_mono(stereo)
+
 
 class VisualizerStyle(Enum):
     """Visualizer style enumeration."""
@@ -14,6 +114,10 @@ class VisualizerStyle(Enum):
     BARS = "bars"              # Simplified spectrum bars
 
 
+# Style that cycle_style moves to from each style, wrapping around
+_NEXT_STYLE = dict(zip(VisualizerStyle, list(VisualizerStyle)[1:] + list(VisualizerStyle)[:1]))
+
+
 class AudioVisualizer:
     """Real-time audio analysis and visualization data generator."""
 
@@ -28,15 +132,30 @@ class AudioVisualizer:
         self.fft_size = fft_size
         self.current_style = VisualizerStyle.SPECTRUM
 
-        # Pre-compute Hanning window for FFT
-        self.window = np.hanning(fft_size)
-
-        # Data buffers
-        self.spectrum_data = np.zeros(32, dtype=np.float32)
-        self.waveform_data = np.zeros(100, dtype=np.float32)
+        # Hanning window for FFT (shared, read-only) and a buffer for the
+        # windowed frame
+        self.window = _hanning_window(fft_size)
+        self._windowed = _aligned_empty(fft_size)
+        # Magnitudes of the fft_size // 2 + 1 positive-frequency bins
+        self._magnitude = _aligned_empty(fft_size // 2 + 1)
+
+        # Resampling indices, keyed by (kind, input length, output length)
+        self._index_cache: Dict[Tuple[str, int, int], np.ndarray] = {}
+        # Band (starts, counts) tables, keyed by (input length, bands)
+        self._band_cache: Dict[Tuple[int, int], Tuple[np.ndarray, np.ndarray]] = {}
+
+        # Data buffers, allocated once and updated in place every frame
+        self.spectrum_data = np.zeros(SPECTRUM_BINS, dtype=np.float32)
+        self.waveform_data = np.zeros(WAVEFORM_SAMPLES, dtype=np.float32)
         self.vu_left = 0.0
         self.vu_right = 0.0
 
+        # Stereo input is split into contiguous per-channel buffers (plus
+        # their mono downmix), reused while the block size stays the same
+        self._left = np.empty(0, dtype=np.float32)
+        self._right = np.empty(0, dtype=np.float32)
+        self._mono_buffer = np.empty(0, dtype=np.float32)
+
         # Smoothing factor for VU meter (0-1, higher = smoother)
         self.vu_smoothing = 0.8
 
@@ -49,8 +168,14 @@ class AudioVisualizer:
         if pcm_data.size == 0:
             return
 
-        # Convert to mono if stereo
-        mono_data = stereo_to_mono(pcm_data)
+        if pcm_data.ndim == 2 and pcm_data.shape[1] == 2:
+            # Split interleaved stereo into contiguous channels so every
+            # pass below runs at unit stride, then mix down once
+            left, right = self._split_channels(pcm_data)
+            mono_data = np.add(left, right, out=self._mono_buffer)
+            mono_data *= 0.5
+        else:
+            left = right = mono_data = stereo_to_mono(pcm_data)
 
         # Update spectrum data (FFT)
         self._update_spectrum(mono_data)
@@ -59,7 +184,76 @@ class AudioVisualizer:
         self._update_waveform(mono_data)
 
         # Update VU meter
-        self._update_vu_meter(pcm_data)
+        left_rms = calculate_rms(left)
+        right_rms = left_rms if right is left else calculate_rms(right)
+        self._update_vu_levels(left_rms, right_rms)
+
+    def process_audio_batch(self, frames: np.ndarray) -> np.ndarray:
+        """Compute spectrum levels for many mono frames at once.
+
+        Meant for offline analysis (e.g. precomputing a whole track); the
+        live visualization buffers are left untouched. Each row gives the
+        same levels process_audio would put in spectrum_data for it.
+
+        Args:
+            frames: Mono PCM frames with shape (frames, samples)
+
+        Returns:
+            Spectrum levels with shape (frames, SPECTRUM_BINS), float32
+        """
+        frames = np.asarray(frames, dtype=np.float32)
+        if frames.ndim != 2 or frames.shape[1] == 0:
+            raise ValueError("frames must have shape (frames, samples)")
+
+        # Window the last fft_size samples of every frame in one broadcast
+        frames = frames[:, -self.fft_size:]
+        windowed = frames * self.window[:frames.shape[1]]
+
+        # One batched FFT over all rows
+        log_magnitude = np.abs(_rfft(windowed, self.fft_size, workers=-1))
+        log_magnitude /= self.fft_size / 2
+        log_magnitude += EPSILON
+        np.log10(log_magnitude, out=log_magnitude)
+
+        # Per-frame adaptive range, as in _update_spectrum
+        min_val, max_val = np.percentile(log_magnitude, [5, 98], axis=1, keepdims=True)
+        span = max_val - min_val
+
+        length = log_magnitude.shape[1]
+        if length > SPECTRUM_BINS:
+            starts, counts = self._band_table(length, SPECTRUM_BINS)
+            levels = np.add.reduceat(log_magnitude, starts, axis=1)
+            levels /= counts
+        else:
+            levels = np.zeros((len(frames), SPECTRUM_BINS), dtype=np.float32)
+            levels[:, :length] = log_magnitude
+
+        levels -= min_val
+        np.divide(levels, span, out=levels, where=span >= EPSILON)
+        levels[(span < EPSILON)[:, 0]] = 0
+        np.clip(levels, 0.0, 1.0, out=levels)
+        np.sqrt(levels, out=levels)
+        if length < SPECTRUM_BINS:
+            levels[:, length:] = 0
+        return levels.astype(np.float32, copy=False)
+
+    def _split_channels(self, pcm_data: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Copy stereo (samples, 2) PCM into the float32 channel buffers.
+
+        Args:
+            pcm_data: Interleaved stereo PCM data
+
+        Returns:
+            Tuple of (left, right) contiguous float32 arrays
+        """
+        n = len(pcm_data)
+        if len(self._left) != n:
+            self._left = _aligned_empty(n)
+            self._right = _aligned_empty(n)
+            self._mono_buffer = _aligned_empty(n)
+        np.copyto(self._left, pcm_data[:, 0], casting='unsafe')
+        np.copyto(self._right, pcm_data[:, 1], casting='unsafe')
+        return self._left, self._right
 
     def _update_spectrum(self, pcm_data: np.ndarray):
         """Update frequency spectrum data using FFT.
@@ -67,54 +261,75 @@ class AudioVisualizer:
         Args:
             pcm_data: Mono PCM data
         """
-        # Ensure we have enough data
-        if len(pcm_data) < self.fft_size:
-            # Pad with zeros
-            pcm_data = np.pad(pcm_data, (0, self.fft_size - len(pcm_data)))
-        else:
-            # Take last fft_size samples
-            pcm_data = pcm_data[-self.fft_size:]
+        # Take the last fft_size samples; shorter input is zero-padded by the FFT
+        pcm_data = pcm_data[-self.fft_size:]
+        n = len(pcm_data)
 
         # Apply window function to reduce spectral leakage
-        windowed = pcm_data * self.window
+        windowed = np.multiply(pcm_data, self.window[:n], out=self._windowed[:n])
+
+        # Compute FFT in single precision (real FFT for real-valued input,
+        # only the N/2+1 positive bins)
+        fft_result = _rfft(windowed, self.fft_size)
+        magnitude = np.abs(fft_result, out=self._magnitude)
 
-        # Compute FFT (real FFT for real-valued input)
-        fft_result = np.fft.rfft(windowed)
-        magnitude = np.abs(fft_result)
+        # Each bar is the mean of a log-spaced band of bins; the levels are
+        # computed for those after the range is taken from the full spectrum
+        banded = len(magnitude) > SPECTRUM_BINS
+        if banded:
+            starts, counts = self._band_table(len(magnitude), SPECTRUM_BINS)
+            if NUMBA_AVAILABLE:
+                _spectrum_levels(magnitude, self.fft_size / 2, starts, counts, self.spectrum_data)
+                return
+
+        # The remaining steps work in place on the magnitude array
 
         # Normalize magnitude directly (simpler and more visual)
         # Scale by FFT size to get proper magnitude
-        magnitude = magnitude / (self.fft_size / 2)
+        np.divide(magnitude, self.fft_size / 2, out=magnitude)
 
         # Apply logarithmic scaling for better visualization
         # Add small epsilon to avoid log(0)
-        epsilon = 1e-6
-        log_magnitude = np.log10(magnitude + epsilon)
+        magnitude += EPSILON
+        log_magnitude = np.log10(magnitude, out=magnitude)
 
         # Normalize to 0-1 range with better dynamic range
-        # Use percentile-based normalization for adaptive range
-        max_val = np.percentile(log_magnitude, 98)  # Use 98th percentile as max
-        min_val = np.percentile(log_magnitude, 5)   # Use 5th percentile as min
+        # Use percentile-based normalization for adaptive range:
+        # 5th percentile as min, 98th as max (one partition for both)
+        min_val, max_val = np.percentile(log_magnitude, [5, 98])
+
+        # Average each band in one reduceat pass, written straight into the
+        # spectrum buffer
+        if banded:
+            levels = np.add.reduceat(log_magnitude, starts, out=self.spectrum_data)
+            levels /= counts
+        else:
+            levels = self._resample_spectrum(log_magnitude, SPECTRUM_BINS)
+        padded = len(log_magnitude) < SPECTRUM_BINS
 
         # Avoid division by zero
-        if max_val - min_val < epsilon:
-            normalized = np.zeros_like(log_magnitude)
+        if max_val - min_val < EPSILON:
+            levels.fill(0)
         else:
-            normalized = (log_magnitude - min_val) / (max_val - min_val)
+            levels -= min_val
+            levels /= (max_val - min_val)
 
         # Clip to 0-1
-        normalized = np.clip(normalized, 0.0, 1.0)
+        np.clip(levels, 0.0, 1.0, out=levels)
 
         # Apply very strong gamma correction
         # This keeps normal sounds low, but lets loud sounds reach high
         # Gamma 0.35 means: 0.5 -> 0.19, 0.8 -> 0.46, 1.0 -> 1.0
-        normalized = np.power(normalized, 0.5)
+        np.sqrt(levels, out=levels)
 
         # Allow full 100% height range for peaks
         # No scaling down - loud sounds can reach the top!
 
-        # Resample to desired number of bins using logarithmic scale
-        self.spectrum_data = self._resample_spectrum(normalized, 32)
+        if padded:
+            # Bins past the end of a short spectrum stay empty
+            levels[len(log_magnitude):] = 0
+        if levels is not self.spectrum_data:
+            self.spectrum_data[:] = levels
 
     def _resample_spectrum(self, spectrum: np.ndarray, bins: int) -> np.ndarray:
         """Resample spectrum to desired number of bins using log scale.
@@ -132,22 +347,69 @@ class AudioVisualizer:
             # If spectrum is smaller, just pad
             return np.pad(spectrum, (0, bins - spectrum_len))
 
-        # Create logarithmic indices
-        # Map bins logarithmically across frequency range
-        indices = np.logspace(
-            0,
-            np.log10(spectrum_len),
-            bins,
-            dtype=int
-        )
+        # Sample spectrum at logarithmically spaced indices
+        resampled: np.ndarray = spectrum[self._log_indices(spectrum_len, bins)]
 
-        # Clip indices to valid range
-        indices = np.clip(indices, 0, spectrum_len - 1)
+        return resampled.astype(np.float32)
 
-        # Sample spectrum at these indices
-        resampled = spectrum[indices]
+    def _log_indices(self, length: int, bins: int) -> np.ndarray:
+        """Get indices mapping bins logarithmically across length (cached).
 
-        return resampled.astype(np.float32)
+        Args:
+            length: Input length
+            bins: Number of output bins
+
+        Returns:
+            Integer index array of size bins
+        """
+        key = ('log', length, bins)
+        indices = self._index_cache.get(key)
+        if indices is None:
+            indices = np.logspace(0, np.log10(length), bins, dtype=int)
+            # Clip indices to valid range
+            indices = np.clip(indices, 0, length - 1)
+            self._index_cache[key] = indices
+        return indices
+
+    def _band_table(self, length: int, bins: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the log-spaced bands used to average a spectrum (cached).
+
+        Band b starts at the bin _log_indices samples for bar b and runs up
+        to the next bar's bin. Low bars that share a bin keep one bin each,
+        so np.add.reduceat(spectrum, starts) / counts gives the band means.
+
+        Args:
+            length: Spectrum length
+            bins: Number of bands
+
+        Returns:
+            Tuple of (starts, counts): start indices and float32 band widths
+        """
+        band_key = (length, bins)
+        table = self._band_cache.get(band_key)
+        if table is None:
+            starts = self._log_indices(length, bins)
+            counts = np.diff(starts, append=length)
+            table = (starts, np.maximum(counts, 1).astype(np.float32))
+            self._band_cache[band_key] = table
+        return table
+
+    def _linear_indices(self, length: int, samples: int) -> np.ndarray:
+        """Get evenly spaced indices across length (cached).
+
+        Args:
+            length: Input length
+            samples: Number of output samples
+
+        Returns:
+            Integer index array of size samples
+        """
+        key = ('linear', length, samples)
+        indices = self._index_cache.get(key)
+        if indices is None:
+            indices = np.linspace(0, length - 1, samples, dtype=int)
+            self._index_cache[key] = indices
+        return indices
 
     def _update_waveform(self, pcm_data: np.ndarray):
         """Update waveform data.
@@ -155,45 +417,37 @@ class AudioVisualizer:
         Args:
             pcm_data: Mono PCM data
         """
-        target_samples = 100
+        waveform = self.waveform_data
 
-        if len(pcm_data) < target_samples:
+        if len(pcm_data) < WAVEFORM_SAMPLES:
             # Pad if too short
-            self.waveform_data = np.pad(pcm_data, (0, target_samples - len(pcm_data)))
+            waveform[:len(pcm_data)] = pcm_data
+            waveform[len(pcm_data):] = 0
         else:
-            # Downsample by taking evenly spaced samples
-            indices = np.linspace(0, len(pcm_data) - 1, target_samples, dtype=int)
-            self.waveform_data = pcm_data[indices]
+            # Downsample by taking every stride-th sample through a strided
+            # view; averaging blocks would cancel out the oscillation
+            stride = len(pcm_data) // WAVEFORM_SAMPLES
+            waveform[:] = pcm_data[:WAVEFORM_SAMPLES * stride:stride]
 
         # Normalize to -1 to 1
-        max_val = np.abs(self.waveform_data).max()
+        max_val = max(waveform.max(), -waveform.min())
         if max_val > 0:
-            self.waveform_data = self.waveform_data / max_val
+            waveform /= max_val
 
-    def _update_vu_meter(self, pcm_data: np.ndarray):
+    def _update_vu_levels(self, left_rms: float, right_rms: float):
         """Update VU meter levels.
 
         Args:
-            pcm_data: PCM data (mono or stereo)
+            left_rms: RMS of the left channel (or of mono input)
+            right_rms: RMS of the right channel (or of mono input)
         """
-        if pcm_data.ndim == 2 and pcm_data.shape[1] == 2:
-            # Stereo
-            left_rms = calculate_rms(pcm_data[:, 0])
-            right_rms = calculate_rms(pcm_data[:, 1])
-        else:
-            # Mono
-            left_rms = calculate_rms(pcm_data)
-            right_rms = left_rms
-
-        # Apply smoothing (exponential moving average)
-        self.vu_left = (self.vu_smoothing * self.vu_left +
-                        (1 - self.vu_smoothing) * left_rms)
-        self.vu_right = (self.vu_smoothing * self.vu_right +
-                         (1 - self.vu_smoothing) * right_rms)
-
-        # Clip to 0-1 range
-        self.vu_left = np.clip(self.vu_left, 0.0, 1.0)
-        self.vu_right = np.clip(self.vu_right, 0.0, 1.0)
+        # Apply smoothing (exponential moving average) and clip to 0-1 with
+        # plain float arithmetic; np.clip on a scalar costs far more
+        smoothing = self.vu_smoothing
+        left = smoothing * self.vu_left + (1 - smoothing) * left_rms
+        right = smoothing * self.vu_right + (1 - smoothing) * right_rms
+        self.vu_left = min(max(left, 0.0), 1.0)
+        self.vu_right = min(max(right, 0.0), 1.0)
 
     def get_spectrum(self, bins: int = 32) -> np.ndarray:
         """Get frequency spectrum data.
@@ -202,10 +456,11 @@ class AudioVisualizer:
             bins: Number of frequency bins
 
         Returns:
-            Spectrum array (0-1 range)
+            Spectrum array (0-1 range). For the native bin count this is
+            the internal buffer, updated in place; copy it to keep a frame.
         """
         if bins == len(self.spectrum_data):
-            return self.spectrum_data.copy()
+            return self.spectrum_data
 
         # Resample if different number of bins requested
         return self._resample_spectrum(self.spectrum_data, bins)
@@ -217,15 +472,15 @@ class AudioVisualizer:
             samples: Number of waveform samples
 
         Returns:
-            Waveform array (-1 to 1 range)
+            Waveform array (-1 to 1 range). For the native sample count this
+            is the internal buffer, updated in place; copy it to keep a frame.
         """
         if samples == len(self.waveform_data):
-            return self.waveform_data.copy()
+            return self.waveform_data
 
         # Resample if different number of samples requested
         if samples < len(self.waveform_data):
-            indices = np.linspace(0, len(self.waveform_data) - 1, samples, dtype=int)
-            return self.waveform_data[indices]
+            return np.take(self.waveform_data, self._linear_indices(len(self.waveform_data), samples))
         else:
             return np.pad(self.waveform_data, (0, samples - len(self.waveform_data)))
 
@@ -271,10 +526,7 @@ class AudioVisualizer:
         Returns:
             New visualizer style
         """
-        styles = list(VisualizerStyle)
-        current_index = styles.index(self.current_style)
-        next_index = (current_index + 1) % len(styles)
-        self.current_style = styles[next_index]
+        self.current_style = _NEXT_STYLE[self.current_style]
         return self.current_style
 
     def get_visualization_data(self) -> np.ndarray:
@@ -296,7 +548,11 @@ class AudioVisualizer:
             return self.get_spectrum()
 
     def reset(self):
-        """Reset all visualization buffers to zero."""
+        """Reset all visualization buffers to zero.
+
+        The buffers are cleared in place, so arrays previously returned by
+        get_spectrum/get_waveform stay valid and read as zeros.
+        """
         self.spectrum_data.fill(0)
         self.waveform_data.fill(0)
         self.vu_left = 0.0
@@ -1,18 +1,31 @@
 """Track data model."""
 
+import os
+import sys
 from dataclasses import dataclass, field
-from typing import Optional
-from pathlib import Path
+from functools import lru_cache
+from typing import Optional, Tuple
 
+# Placeholders for untagged files, shared by every such track
+UNKNOWN_ARTIST = sys.intern("Unknown Artist")
+UNKNOWN_ALBUM = sys.intern("Unknown Album")
 
-@dataclass
+
+@lru_cache(maxsize=4096)
+def _format_duration(seconds: int) -> str:
+    """Format whole seconds as MM:SS (minutes are not wrapped into hours)."""
+    minutes, seconds = divmod(seconds, 60)
+    return f"{minutes:02d}:{seconds:02d}"
+
+
+@dataclass(slots=True)
 class Track:
     """Represents a music track with metadata."""
 
     file_path: str
     title: str
-    artist: str = "Unknown Artist"
-    album: str = "Unknown Album"
+    artist: str = UNKNOWN_ARTIST
+    album: str = UNKNOWN_ALBUM
     duration: float = 0.0
     track_number: Optional[int] = None
     year: Optional[int] = None
@@ -26,6 +39,18 @@ class Track:
     annotations: Optional[list] = None  # Genius annotations
     primary_color: Optional[str] = None  # Song art primary color
     secondary_color: Optional[str] = None  # Song art secondary color
+    _display_cache: Optional[Tuple[tuple, str]] = field(default=None, init=False, repr=False, compare=False)
+    _extension: str = field(default="", init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Lowercased suffix, computed once per track
+        self._extension = os.path.splitext(self.file_path)[1].lower()
+
+        # Albums and artists repeat across a library; keep one string per value
+        if type(self.artist) is str:
+            self.artist = sys.intern(self.artist)
+        if type(self.album) is str:
+            self.album = sys.intern(self.album)
 
     @classmethod
     def from_dict(cls, data: dict) -> 'Track':
@@ -37,11 +62,15 @@ class Track:
         Returns:
             Track instance
         """
+        # 'file_path' is only looked up when the serialized 'path' is absent
+        file_path = data.get('path')
+        if file_path is None:
+            file_path = data.get('file_path', '')
         return cls(
-            file_path=data.get('path', data.get('file_path', '')),
+            file_path=file_path,
             title=data.get('title', 'Unknown Title'),
-            artist=data.get('artist', 'Unknown Artist'),
-            album=data.get('album', 'Unknown Album'),
+            artist=data.get('artist', UNKNOWN_ARTIST),
+            album=data.get('album', UNKNOWN_ALBUM),
             duration=data.get('duration', 0.0),
             track_number=data.get('track_number'),
             year=data.get('year'),
@@ -86,12 +115,12 @@ class Track:
     @property
     def filename(self) -> str:
         """Get the filename without path."""
-        return Path(self.file_path).name
+        return os.path.basename(self.file_path)
 
     @property
     def extension(self) -> str:
         """Get the file extension."""
-        return Path(self.file_path).suffix.lower()
+        return self._extension
 
     def format_duration(self) -> str:
         """Format duration as MM:SS.
@@ -99,9 +128,26 @@ class Track:
         Returns:
             Formatted duration string
         """
-        minutes = int(self.duration // 60)
-        seconds = int(self.duration % 60)
-        return f"{minutes:02d}:{seconds:02d}"
+        return _format_duration(int(self.duration))
+
+    @property
+    def display_line(self) -> str:
+        """Get the "Artist - Title (MM:SS)" line shown in track lists.
+
+        The string is built once and reused until artist, title or duration
+        change (e.g. after Spotify enrichment).
+
+        Returns:
+            Formatted display line
+        """
+        key = (self.artist, self.title, self.duration)
+        cache = self._display_cache
+        if cache is None or cache[0] != key:
+            line = f"{self.artist} - {self.title}"
+            if self.duration > 0:
+                line += f" ({self.format_duration()})"
+            cache = self._display_cache = (key, line)
+        return cache[1]
 
     def format_bitrate(self) -> str:
         """Format bitrate in kbps.
@@ -149,7 +195,7 @@ class Track:
         info_lines.append(f"Title: {self.title}")
         info_lines.append(f"Artist: {self.artist}")
 
-        if self.album and self.album != "Unknown Album":
+        if self.album and self.album != UNKNOWN_ALBUM:
             album_str = self.album
             if self.track_number:
                 album_str += f" (Track {self.track_number})"
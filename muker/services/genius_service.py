@@ -2,6 +2,7 @@
 
 import os
 import asyncio
+import functools
 from typing import Optional, List, Dict, Any
 from muker.models.track import Track
 from muker.core.database import DatabaseManager
@@ -298,3 +299,16 @@ class GeniusService:
         )
         
         return translated_text
+
+
+@functools.cache
+def get_genius_service() -> GeniusService:
+    """Get the shared Genius service, creating it on first use.
+
+    All lyrics panels and tracks reuse one Genius/Gemini client and cache
+    database instead of building new ones per panel.
+
+    Returns:
+        Shared GeniusService instance
+    """
+    return GeniusService()
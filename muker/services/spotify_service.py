@@ -1,6 +1,11 @@
 """Spotify API service for fetching track metadata."""
 
+import asyncio
+import functools
+import logging
 import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional, Dict, Any
 import spotipy
@@ -9,18 +14,32 @@ from spotipy.oauth2 import SpotifyClientCredentials
 from muker.models.track import Track
 from muker.core.database import DatabaseManager
 
+log = logging.getLogger(__name__)
+
 
 class SpotifyService:
     """Service for interacting with Spotify Web API."""
 
+    # Cached lyrics older than this are revalidated with the lyrics API
+    LYRICS_CACHE_TTL = 7 * 24 * 60 * 60  # seconds
+
+    # Search results kept in memory, so repeated lookups (duplicate files,
+    # rescans, album art for an enriched track) skip the network
+    SEARCH_CACHE_SIZE = 1024
+
     def __init__(self):
         """Initialize Spotify service."""
         self.sp: Optional[spotipy.Spotify] = None
         self.lyrics_api_url: Optional[str] = None
+        self._lyrics_url_template: Optional[str] = None
         self._load_env_file()
         self._initialize_client()
         self._initialize_lyrics_api()
         self.db = DatabaseManager()
+        # LRU of search query -> track data (None when nothing matched);
+        # searches run on several worker threads at once
+        self._search_cache: OrderedDict = OrderedDict()
+        self._search_lock = threading.Lock()
 
     def _load_env_file(self):
         """Load environment variables from .env file."""
@@ -67,6 +86,9 @@ class SpotifyService:
         """Initialize Spotify Lyrics API URL from environment."""
         self.lyrics_api_url = os.getenv('SPOTIFY_LYRICS_API_URL')
         if self.lyrics_api_url:
+            # Build the request URL template once instead of on every lookup
+            base_url = self.lyrics_api_url.replace('{', '{{').replace('}', '}}')
+            self._lyrics_url_template = base_url + "?trackid={tid}&format={fmt}"
             print(f"[INFO] Spotify Lyrics API configured: {self.lyrics_api_url}")
         else:
             print("[INFO] Spotify Lyrics API URL not configured. Set SPOTIFY_LYRICS_API_URL to enable lyrics.")
@@ -108,18 +130,44 @@ class SpotifyService:
             if not query:
                 return None
 
+            cache_key = query.lower()
+            with self._search_lock:
+                if cache_key in self._search_cache:
+                    self._search_cache.move_to_end(cache_key)
+                    return self._search_cache[cache_key]
+
             # Search on Spotify
             results = self.sp.search(q=query, type='track', limit=1)
 
+            found = None
             if results and results['tracks']['items']:
-                return results['tracks']['items'][0]
+                found = results['tracks']['items'][0]
 
-            return None
+            # Failed requests raise above and are not cached
+            with self._search_lock:
+                self._search_cache[cache_key] = found
+                if len(self._search_cache) > self.SEARCH_CACHE_SIZE:
+                    self._search_cache.popitem(last=False)
+
+            return found
 
         except Exception as e:
             print(f"[ERROR] Spotify search failed: {e}")
             return None
 
+    async def search_track_async(self, artist: str, title: str, album: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Search for a track on Spotify without blocking the event loop.
+
+        Args:
+            artist: Artist name
+            title: Track title
+            album: Album name (optional)
+
+        Returns:
+            Track data dict if found, None otherwise
+        """
+        return await asyncio.to_thread(self.search_track, artist, title, album)
+
     def enrich_track(self, track: Track) -> Track:
         """Enrich track metadata with Spotify data.
 
@@ -187,6 +235,17 @@ class SpotifyService:
 
         return track
 
+    async def enrich_track_async(self, track: Track) -> Track:
+        """Enrich track metadata with Spotify data in a worker thread.
+
+        Args:
+            track: Track to enrich
+
+        Returns:
+            Track with enriched metadata
+        """
+        return await asyncio.to_thread(self.enrich_track, track)
+
     def get_track_audio_features(self, spotify_id: str) -> Optional[Dict[str, Any]]:
         """Get audio features for a track.
 
@@ -247,51 +306,66 @@ class SpotifyService:
             Lyrics data dict if found, None otherwise
         """
         # 1. Check Cache
-        cached_lyrics = self.db.get_spotify_lyrics(track_id)
-        if cached_lyrics:
+        cached = self.db.get_spotify_lyrics_entry(track_id)
+        cached_lyrics: Optional[Dict[str, Any]] = cached['lyrics'] if cached else None
+        if cached_lyrics and (
+            not self.lyrics_api_url
+            or not cached['etag']
+            or cached['age'] < self.LYRICS_CACHE_TTL
+        ):
             print(f"[INFO] Loaded lyrics for track {track_id} from cache")
             return cached_lyrics
 
-        if not self.lyrics_api_url:
+        template = self._lyrics_url_template
+        if not self.lyrics_api_url or template is None:
             return None
 
         try:
             import requests
 
             # Build API request URL
-            url = f"{self.lyrics_api_url}?trackid={track_id}&format={format}"
+            url = template.format(tid=track_id, fmt=format)
+
+            # Revalidate stale cache entries instead of re-downloading them
+            headers = {'If-None-Match': cached['etag']} if cached_lyrics else {}
 
             # Make request to lyrics API
-            response = requests.get(url, timeout=10)
+            response = requests.get(url, headers=headers, timeout=10)
+
+            if response.status_code == 304 and cached_lyrics:
+                print(f"[INFO] Cached lyrics for track {track_id} are still current")
+                self.db.touch_spotify_lyrics(track_id)
+                return cached_lyrics
+
             response.raise_for_status()
 
             lyrics_data = response.json()
-            print(f"[DEBUG-LYRICS-API] Raw response: {lyrics_data}")
+            log.debug("Raw lyrics API response: %s", lyrics_data)
 
             # Check if lyrics were found
             if lyrics_data.get('error'):
                 print(f"[WARNING] Lyrics API error: {lyrics_data.get('message', 'Unknown error')}")
-                return None
+                return cached_lyrics
 
             print(f"[INFO] Fetched lyrics for track {track_id} (format: {format})")
             
             # 2. Save to Cache
-            self.db.save_spotify_lyrics(track_id, lyrics_data)
+            self.db.save_spotify_lyrics(track_id, lyrics_data, response.headers.get('ETag'))
             
             return lyrics_data
 
         except ImportError:
             print("[ERROR] requests library not installed. Install with: pip install requests")
-            return None
+            return cached_lyrics
         except requests.exceptions.Timeout:
             print("[ERROR] Lyrics API request timed out")
-            return None
+            return cached_lyrics
         except requests.exceptions.RequestException as e:
             print(f"[ERROR] Failed to fetch lyrics: {e}")
-            return None
+            return cached_lyrics
         except Exception as e:
             print(f"[ERROR] Unexpected error fetching lyrics: {e}")
-            return None
+            return cached_lyrics
 
     def enrich_track_with_lyrics(self, track: Track, format: str = "lrc") -> Track:
         """Enrich track with lyrics data.
@@ -311,3 +385,28 @@ class SpotifyService:
             track.lyrics = lyrics_data
 
         return track
+
+    async def enrich_track_with_lyrics_async(self, track: Track, format: str = "lrc") -> Track:
+        """Enrich track with lyrics data in a worker thread.
+
+        Args:
+            track: Track to enrich with lyrics
+            format: Lyrics format ('lrc' or 'id3')
+
+        Returns:
+            Track with lyrics data
+        """
+        return await asyncio.to_thread(self.enrich_track_with_lyrics, track, format)
+
+
+@functools.cache
+def get_spotify_service() -> SpotifyService:
+    """Get the shared Spotify service, creating it on first use.
+
+    Loading credentials, building the client and opening the cache database
+    only happens once, and only when Spotify is actually needed.
+
+    Returns:
+        Shared SpotifyService instance
+    """
+    return SpotifyService()
@@ -0,0 +1,18 @@
+"""Messages shared between UI components."""
+
+from textual.message import Message
+
+# Widgets that do their periodic updates on UITick
+UI_TICK_TARGETS = "PlayerControls, PlaylistView, LyricsPanel"
+
+
+class UITick(Message, bubble=False):
+    """Periodic tick sent to widgets by the app's single UI timer.
+
+    Widgets handle it in on_uitick and use the running count to do slower
+    work only every Nth tick.
+    """
+
+    def __init__(self, count: int):
+        super().__init__()
+        self.count = count
@@ -1,5 +1,6 @@
 """Main screen for Muker music player."""
 
+import logging
 from pathlib import Path
 from textual.screen import Screen
 from textual.containers import Container, Vertical, Horizontal
@@ -17,6 +18,8 @@ from muker.ui.widgets.playlist_view import PlaylistView
 from muker.ui.widgets.player_controls import PlayerControls
 from muker.ui.widgets.library_browser import LibraryBrowser
 
+log = logging.getLogger(__name__)
+
 
 class MainScreen(Screen):
     """Main screen with player interface."""
@@ -151,16 +154,11 @@ class MainScreen(Screen):
 
         try:
             self.notify(f"Scanning {music_dir}...", timeout=2)
-            print(f"[DEBUG] Scanning directory: {music_dir}")
-
-            # Scan directory for music files
-            tracks = await self.library.scan_directory(music_dir, recursive=True)
-            print(f"[DEBUG] Found {len(tracks)} tracks")
+            log.debug("Scanning directory: %s", music_dir)
 
-            # Add tracks to playlist
-            self.playlist.clear()
-            self.playlist.add_tracks(tracks)
-            print(f"[DEBUG] Added {len(tracks)} tracks to playlist")
+            # Tracks show up in the playlist as they are found
+            tracks = await self.library.scan_into_playlist(music_dir, self.playlist)
+            log.debug("Loaded %d tracks into playlist", len(tracks))
 
             self.notify(f"Loaded {len(tracks)} tracks", severity="information", timeout=3)
 
@@ -168,21 +166,21 @@ class MainScreen(Screen):
             try:
                 playlist_view = self.query_one(PlaylistView)
                 if playlist_view:
-                    print("[DEBUG] Forcing playlist view update")
-                    playlist_view.update_playlist()
+                    log.debug("Forcing playlist view update")
+                    playlist_view.check_updates()
             except Exception as ex:
-                print(f"[DEBUG] Could not update playlist view: {ex}")
+                log.debug("Could not update playlist view: %s", ex)
 
-            # Start playing first track if available
+            # Start playing the current track unless it is already playing
             if tracks:
                 first_track = self.playlist.get_current_track()
-                print(f"[DEBUG] First track: {first_track.title if first_track else 'None'}")
-                if first_track:
-                    print(f"[DEBUG] Loading first track: {first_track.file_path}")
+                log.debug("First track: %s", first_track.title if first_track else None)
+                if first_track and not self.player.is_playing_file(first_track.file_path):
+                    log.debug("Loading first track: %s", first_track.file_path)
                     await self.player.load_track(first_track)
                     await self.player.play()
             else:
-                print("[DEBUG] No tracks to play")
+                log.debug("No tracks to play")
         except Exception as e:
             # Handle error (would show error dialog in full implementation)
             import traceback
@@ -1,14 +1,61 @@
 "Lyrics panel widget for displaying synchronized lyrics."
 
+import asyncio
+import bisect
+import logging
+import re
+import time
+import unicodedata
+from difflib import SequenceMatcher
 from textual.widget import Widget
 from textual.widgets import Label
+from textual.message import Message
 from textual.containers import VerticalScroll
 from textual import work
-from typing import Optional, List, Dict, Any, Callable
+from typing import Optional, List, Dict, Any, Callable, Set, Tuple
 from muker.core.player import AudioPlayer
 from muker.core.playlist import PlaylistManager
-from muker.services.genius_service import GeniusService
+from muker.models.track import Track
+from muker.services.genius_service import get_genius_service
 from muker.ui.screens.annotation_popup import AnnotationPopup
+from muker.ui.messages import UITick
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+log = logging.getLogger(__name__)
+
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+_WHITESPACE_RE = re.compile(r'\s+')
+_TIME_RE = re.compile(r'^(\d+):(\d+(?:\.\d+)?)$')
+
+
+def _clean_text(text: str) -> str:
+    """Normalize text for fuzzy lyric/annotation matching."""
+    # 1. Normalize Unicode
+    text = unicodedata.normalize('NFKC', text)
+    # 2. Remove non-alphanumeric characters (punctuation), keep whitespace
+    text = _PUNCTUATION_RE.sub('', text)
+    # 3. Collapse all whitespace to single space
+    text = _WHITESPACE_RE.sub(' ', text)
+    return text.strip().lower()
+
+
+def _parse_time(tag: str, _re=_TIME_RE) -> float:
+    """Parse an "MM:SS.xx" time tag into seconds (0.0 if malformed)."""
+    m = _re.match(tag)
+    return int(m.group(1)) * 60 + float(m.group(2)) if m else 0.0
+
+
+def _ngrams(text: str, n: int = 3) -> set:
+    """Character n-grams of text (the whole string if shorter than n)."""
+    if len(text) < n:
+        return {text}
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
 
 class LyricLine(Label):
     """A single line of lyrics."""
@@ -39,9 +86,28 @@ class LyricLine(Label):
         self.timestamp = timestamp
         self.annotations = annotations or []
         self.on_click_callback = on_click_callback
+        self._is_active = False
         if self.annotations:
             self.add_class("has-annotation")
 
+    def activate(self) -> bool:
+        """Highlight this line.
+
+        Returns:
+            True if the line was not active before
+        """
+        if self._is_active:
+            return False
+        self._is_active = True
+        self.add_class("active")
+        return True
+
+    def deactivate(self):
+        """Remove the highlight from this line."""
+        if self._is_active:
+            self._is_active = False
+            self.remove_class("active")
+
     def on_click(self) -> None:
         """Handle click event."""
         if self.annotations and self.on_click_callback:
@@ -67,22 +133,64 @@ class LyricsPanel(Widget):
     }
     """
 
+    class TrackChanged(Message):
+        """Message sent when the playlist's current track changes."""
+
+        def __init__(self, track: Optional[Track]):
+            super().__init__()
+            self.track = track
+
     def __init__(self, player: AudioPlayer, playlist: PlaylistManager):
         """Initialize lyrics panel."""
         super().__init__()
         self.player = player
         self.playlist = playlist
-        self.genius_service = GeniusService()
+        self.genius_service = get_genius_service()
         self.current_track_path: Optional[str] = None
         self.lines: List[LyricLine] = []
         self.is_synced = False
+        self._line_timer = None
+
+        # Line timestamps (parallel to self.lines) and the highlighted line index
+        self._timestamps: List[float] = []
+        self._active_idx = -1
+        # When the last scroll animation started, to avoid stacking animations
+        self._last_scroll_time = 0.0
+        # (track path, annotations, lines) that annotations were last applied to
+        self._applied_annotations_for = None
 
     def compose(self):
         yield VerticalScroll(id="lyrics-scroll")
 
     def on_mount(self):
         """Called when widget is mounted."""
-        self.set_interval(0.1, self.update_lyrics_display)
+        self.playlist.add_track_changed_callback(self._post_track_changed)
+        self.call_later(self.update_lyrics_display)
+
+    def on_unmount(self):
+        """Called when widget is unmounted."""
+        self.playlist.remove_track_changed_callback(self._post_track_changed)
+
+    def _post_track_changed(self, track: Optional[Track]):
+        """Playlist callback; may run off the UI thread, so go through a message."""
+        self.post_message(self.TrackChanged(track))
+
+    async def on_lyrics_panel_track_changed(self, message: TrackChanged):
+        """Reload lyrics when the current track changes."""
+        await self.update_lyrics_display()
+
+    async def on_uitick(self, message: UITick):
+        """Run the safety check roughly once a second."""
+        # Track changes arrive as messages; this slow check only catches lyrics
+        # that arrive after the track started and re-syncs the active line after seeks
+        if message.count % 16 == 0:
+            await self._safety_check()
+
+    async def _safety_check(self):
+        """Periodic fallback for changes that are not signalled."""
+        await self.update_lyrics_display()
+        if self.is_synced and self.lines:
+            self._sync_active_line()
 
     async def update_lyrics_display(self):
         """Update lyrics display based on current track and position."""
@@ -105,17 +213,39 @@ class LyricsPanel(Widget):
              await self._load_lyrics(current_track)
              self._fetch_annotations(current_track)
 
-        # Update active line
-        if self.is_synced and self.lines:
-            self._update_active_line()
+    def _cancel_line_timer(self):
+        """Cancel the pending active-line update, if any."""
+        if self._line_timer is not None:
+            self._line_timer.stop()
+            self._line_timer = None
+
+    def _sync_active_line(self):
+        """Highlight the current line and schedule the next update.
+
+        Instead of polling, a single timer is set to fire when playback reaches
+        the next line's timestamp. Unsynced lyrics never schedule anything.
+        """
+        self._cancel_line_timer()
+        if not self.is_synced or not self.lines:
+            return
+
+        self._update_active_line()
+
+        next_idx = self._active_idx + 1
+        if next_idx < len(self._timestamps):
+            delay = max(0.05, self._timestamps[next_idx] - self.player.get_position())
+            self._line_timer = self.set_timer(delay, self._sync_active_line)
 
     def _clear_lyrics(self, message: str):
         """Clear lyrics display."""
         try:
+            self._cancel_line_timer()
             scroll = self.query_one("#lyrics-scroll", VerticalScroll)
             scroll.remove_children()
             scroll.mount(Label(message, classes="info-msg"))
             self.lines = []
+            self._timestamps = []
+            self._active_idx = -1
             self.current_track_path = None
         except Exception:
             pass
@@ -123,9 +253,12 @@ class LyricsPanel(Widget):
     async def _load_lyrics(self, track):
         """Load lyrics for the track."""
         try:
+            self._cancel_line_timer()
             scroll = self.query_one("#lyrics-scroll", VerticalScroll)
             await scroll.remove_children()
             self.lines = []
+            self._timestamps = []
+            self._active_idx = -1
 
             if not track.lyrics or 'lines' not in track.lyrics:
                  scroll.mount(Label("No lyrics available", classes="info-msg"))
@@ -133,24 +266,13 @@ class LyricsPanel(Widget):
                  return
 
             self.is_synced = track.lyrics.get('syncType') == "LINE_SYNCED"
-            print(f"[DEBUG] Lyrics loaded. Synced: {self.is_synced}, Lines: {len(self.lines)}")
             
-            # Helper to parse time
-            def parse_time(tag):
-                try:
-                    parts = tag.split(':')
-                    if len(parts) == 2:
-                        return int(parts[0]) * 60 + float(parts[1])
-                    return 0.0
-                except:
-                    return 0.0
-
             for line_data in track.lyrics['lines']:
                 text = line_data.get('words', '')
                 if not text.strip():
                     continue
                     
-                time = parse_time(line_data.get('timeTag', '00:00'))
+                time = _parse_time(line_data.get('timeTag', '00:00'))
                 
                 # Initialize with empty annotations list and callback
                 line_widget = LyricLine(
@@ -160,125 +282,205 @@ class LyricsPanel(Widget):
                     on_click_callback=self.on_annotation_click
                 )
                 self.lines.append(line_widget)
-                await scroll.mount(line_widget)
-            
-            print(f"[DEBUG] Lyrics loaded. Synced: {self.is_synced}, Lines: {len(self.lines)}")
+                self._timestamps.append(time)
+
+            # Mount every line in one go so layout runs once, not per line
+            with self.app.batch_update():
+                await scroll.mount_all(self.lines)
+
+            log.debug("Lyrics loaded. Synced: %s, Lines: %d", self.is_synced, len(self.lines))
+            self._sync_active_line()
                 
         except Exception as e:
-            print(f"[ERROR] Failed to load lyrics: {e}")
+            log.error("Failed to load lyrics: %s", e)
 
     @work(exclusive=True)
     async def _fetch_annotations(self, track):
-        """Fetch annotations and update lines."""
-        if not self.genius_service.is_available():
-            return
+        """Fetch annotations and update lines.
 
-        await self.genius_service.enrich_track_with_annotations(track)
-        
-        if track.annotations:
-            # Map annotations to lines safely on main thread
-            self._apply_annotations(track.annotations)
+        Tracks that already carry annotations (e.g. when lyrics arrive late)
+        skip the Genius lookup, and annotations already applied to the
+        current lines are not matched again.
+        """
+        if not track.annotations:
+            if not self.genius_service.is_available():
+                return
+            await self.genius_service.enrich_track_with_annotations(track)
+
+        lines = self.lines
+        applied = self._applied_annotations_for
+        already_applied = (
+            applied is not None
+            and applied[0] == track.file_path
+            and applied[1] is track.annotations
+            and applied[2] is lines
+        )
+        if track.annotations and lines and not already_applied:
+            # Match in a thread, then touch widgets only on the main thread
+            line_texts = [line.text_content for line in lines]
+            matches = await asyncio.to_thread(self._compute_matches, line_texts, track.annotations)
+            if self.lines is lines:
+                self._apply_annotations(matches)
+                self._applied_annotations_for = (track.file_path, track.annotations, lines)
 
         # Update theme colors if available
         if track.primary_color and track.secondary_color:
             if hasattr(self.app, 'update_theme_colors'):
                 self.app.update_theme_colors(track.primary_color, track.secondary_color)
 
-    def _apply_annotations(self, annotations: List[Dict[str, Any]]):
-        """Apply annotations to lyric lines (Main Thread)."""
-        import re
-        import unicodedata
-        from difflib import SequenceMatcher
-
-        def clean_text(text: str) -> str:
-            # 1. Normalize Unicode
-            text = unicodedata.normalize('NFKC', text)
-            # 2. Remove non-alphanumeric characters (punctuation), keep whitespace
-            text = re.sub(r'[^\w\s]', '', text)
-            # 3. Collapse all whitespace to single space
-            text = re.sub(r'\s+', ' ', text)
-            return text.strip().lower()
-
-        for line_widget in self.lines:
-            # Normalize line text
-            line_clean = clean_text(line_widget.text_content)
+    def _apply_annotations(self, matches: List[Tuple[int, Dict[str, Any]]]):
+        """Apply matched annotations to lyric lines (Main Thread)."""
+        for idx, ann in matches:
+            line_widget = self.lines[idx]
+            # Store the full annotation dictionary
+            line_widget.annotations.append(ann)
+            line_widget.add_class("has-annotation")
+
+    @staticmethod
+    def _compute_matches(
+        line_texts: List[str], annotations: List[Dict[str, Any]]
+    ) -> List[Tuple[int, Dict[str, Any]]]:
+        """Match annotations to lyric lines (pure, safe to run in a thread).
+
+        Args:
+            line_texts: Text of each lyric line
+            annotations: Annotation dictionaries with a 'fragment' key
+
+        Returns:
+            (line index, annotation) pairs, at most one per line
+        """
+        matches = []
+        cleaned_lines = [_clean_text(text) for text in line_texts]
+
+        # Inverted index: trigram -> indices of lines containing it. Fuzzy
+        # matching only runs against lines sharing a trigram with the fragment.
+        ngram_index: Dict[str, set] = {}
+        for i, line_clean in enumerate(cleaned_lines):
+            if line_clean:
+                for gram in _ngrams(line_clean):
+                    ngram_index.setdefault(gram, set()).add(i)
+
+        # Clean every annotation fragment once instead of once per lyric line
+        cleaned_annotations = []
+        fragment_ids: Dict[str, List[int]] = {}
+        sub_id = 0
+        for ann in annotations:
+            raw_fragment = ann['fragment']
+            sub_fragments = raw_fragment.split('\n')
+
+            # IMPORTANT: Also check the FULL fragment as a single block.
+            if len(sub_fragments) > 1:
+                sub_fragments.append(raw_fragment)
+
+            cleaned_subs = []
+            for sub in sub_fragments:
+                sub_clean = _clean_text(sub)
+                if not sub_clean or len(sub_clean) < 2:
+                    continue
+                candidates: Set[int] = set()
+                for gram in _ngrams(sub_clean):
+                    candidates.update(ngram_index.get(gram, ()))
+                # SequenceMatcher caches its analysis of the second sequence
+                matcher = SequenceMatcher(None, '', sub_clean)
+                cleaned_subs.append((sub_id, sub_clean, set(sub_clean.split()), candidates, matcher))
+                fragment_ids.setdefault(sub_clean, []).append(sub_id)
+                sub_id += 1
+            cleaned_annotations.append((ann, cleaned_subs))
+
+        # Aho-Corasick automaton over all fragments: one pass per line finds
+        # every fragment contained in it
+        automaton = None
+        if AHOCORASICK_AVAILABLE and fragment_ids:
+            automaton = ahocorasick.Automaton()
+            for sub_clean, ids in fragment_ids.items():
+                automaton.add_word(sub_clean, ids)
+            automaton.make_automaton()
+
+        for i, line_clean in enumerate(cleaned_lines):
             if not line_clean:
                 continue
-            
+            line_tokens = line_clean.split()
+            contained = None
+            if automaton is not None:
+                contained = {hit for _, ids in automaton.iter(line_clean) for hit in ids}
+
             matched = False
-            
-            for ann in annotations:
-                raw_fragment = ann['fragment']
-                sub_fragments = raw_fragment.split('\n')
-                
-                # IMPORTANT: Also check the FULL fragment as a single block.
-                if len(sub_fragments) > 1:
-                    sub_fragments.append(raw_fragment)
-                
-                for sub in sub_fragments:
-                    sub_clean = clean_text(sub)
-                    
-                    if not sub_clean or len(sub_clean) < 2:
-                        continue
-                    
+
+            for ann, cleaned_subs in cleaned_annotations:
+                for sub_id, sub_clean, sub_tokens, candidates, matcher in cleaned_subs:
+                    sub_in_line = sub_id in contained if contained is not None else sub_clean in line_clean
+
                     # 1. Bidirectional Substring Match
-                    if sub_clean in line_clean or line_clean in sub_clean:
+                    if sub_in_line or line_clean in sub_clean:
                         matched = True
-                    
-                    # 2. Fuzzy Similarity Match
-                    elif SequenceMatcher(None, line_clean, sub_clean).ratio() > 0.55:
+
+                    # 2. Fuzzy Similarity Match (cheap upper bounds first)
+                    elif i in candidates and LyricsPanel._fuzzy_match(matcher, line_clean):
                         matched = True
-                            
+
                     # 3. Word Subset Match
-                    else:
-                        line_tokens = line_clean.split()
-                        sub_tokens = set(sub_clean.split())
-                        
-                        if len(line_tokens) >= 2:
-                            match_count = sum(1 for t in line_tokens if t in sub_tokens)
-                            subset_ratio = match_count / len(line_tokens)
-                            
-                            if subset_ratio >= 0.55:
-                                matched = True
+                    elif len(line_tokens) >= 2:
+                        match_count = sum(1 for t in line_tokens if t in sub_tokens)
+                        subset_ratio = match_count / len(line_tokens)
+
+                        if subset_ratio >= 0.55:
+                            matched = True
 
                     if matched:
-                        # Store the full annotation dictionary
-                        line_widget.annotations.append(ann)
-                        break 
-                
+                        matches.append((i, ann))
+                        break
+
                 if matched:
                     break
-            
-            if matched:
-                line_widget.add_class("has-annotation")
+
+        return matches
+
+    @staticmethod
+    def _fuzzy_match(matcher: SequenceMatcher, line_clean: str) -> bool:
+        """Check whether a line is similar enough to the matcher's fragment.
+
+        Args:
+            matcher: SequenceMatcher with the cleaned fragment as seq2
+            line_clean: Cleaned lyric line
+
+        Returns:
+            True if the similarity ratio exceeds the threshold
+        """
+        matcher.set_seq1(line_clean)
+        return (matcher.real_quick_ratio() > 0.55
+                and matcher.quick_ratio() > 0.55
+                and matcher.ratio() > 0.55)
 
     def _update_active_line(self):
         """Highlight the current line."""
         position = self.player.get_position()
-        active_idx = -1
-        
-        # Find active line (the one with largest timestamp <= position)
-        for i, line in enumerate(self.lines):
-            if line.timestamp <= position:
-                active_idx = i
-            else:
-                break
-        
-        # Update classes
-        for i, line in enumerate(self.lines):
-            if i == active_idx:
-                if not line.has_class("active"):
-                    line.add_class("active")
-                    line.refresh() # Force refresh
-                    # Scroll to keep in view
-                    try:
-                        line.scroll_visible(animate=True, top=False, duration=0.5)
-                    except Exception as e:
-                        print(f"[ERROR] Scroll failed: {e}")
-            else:
-                if line.has_class("active"):
-                    line.remove_class("active")
-                    line.refresh() # Force refresh
+
+        # Active line is the one with the largest timestamp <= position
+        active_idx = bisect.bisect_right(self._timestamps, position) - 1
+        if active_idx == self._active_idx:
+            return
+
+        # Only the previously active and the newly active line change
+        if 0 <= self._active_idx < len(self.lines):
+            self.lines[self._active_idx].deactivate()
+
+        self._active_idx = active_idx
+
+        if active_idx >= 0:
+            line = self.lines[active_idx]
+            if not line.activate():
+                return
+            # Scroll to keep in view, unless the line is already visible
+            try:
+                scroll = self.query_one("#lyrics-scroll", VerticalScroll)
+                if not scroll.content_region.contains_region(line.region):
+                    # Jump instead of animating if the last animation may still be running
+                    now = time.monotonic()
+                    animate = now - self._last_scroll_time > 0.5
+                    self._last_scroll_time = now
+                    line.scroll_visible(animate=animate, top=False, duration=0.5)
+            except Exception as e:
+                log.warning("Scroll failed: %s", e)
 
     def on_annotation_click(self, title: str, annotation: Dict[str, Any]):
         """Handle annotation click."""
@@ -1,12 +1,31 @@
 """Player controls widget."""
 
+from typing import Dict, Optional
+
 from textual.widget import Widget
+from rich.console import Group, JustifyMethod
 from rich.text import Text
 from rich.panel import Panel
 
 from muker.core.player import AudioPlayer
 from muker.core.playlist import PlaylistManager
 from muker.utils.audio_utils import format_time
+from muker.ui.messages import UITick
+
+# Constant fragments, allocated once
+NO_TRACK_TEXT = Text("No track loaded", style="dim")
+LYRICS_HINT_TEXT = Text("  │  📜 Lyrics (l)", style="bold purple")
+BLANK_TEXT = Text("")
+
+# CSS text-align values -> Rich justify methods
+JUSTIFY_METHODS: Dict[str, JustifyMethod] = {
+    "start": "left",
+    "left": "left",
+    "center": "center",
+    "right": "right",
+    "end": "right",
+    "justify": "full",
+}
 
 
 class PlayerControls(Widget):
@@ -22,22 +41,65 @@ class PlayerControls(Widget):
         super().__init__()
         self.player = player
         self.playlist = playlist
+        self._last_render_key: Optional[tuple] = None
+        self._header_key: Optional[tuple] = None
+        self._header_text = Text()
+        self._progress_key: Optional[tuple] = None
+        self._progress_text = Text()
+        self._controls_key: Optional[tuple] = None
+        self._controls_text = Text()
+
+    def on_uitick(self, message: UITick):
+        """Poll player state on every UI tick (~15 Hz)."""
+        self._tick()
+
+    def _progress_bar_width(self) -> int:
+        """Width of the progress bar for the current widget size."""
+        # Use full width minus some padding
+        return max(60, self.size.width - 30) if self.size.width > 30 else 40
 
-    def on_mount(self):
-        """Called when widget is mounted."""
-        # Update display frequently
-        self.set_interval(0.1, self.refresh)
+    def _tick(self):
+        """Refresh only if something visible changed since the last tick."""
+        progress = self.player.get_progress()
+        key = (
+            self.playlist.current_index,
+            id(self.playlist.get_current_track()),
+            int(self.player.get_position()),
+            int(self.player.get_duration()),
+            int(progress * self._progress_bar_width()),
+            int(progress * 100),
+            self.player.is_playing,
+            self.player.is_paused,
+            int(self.player.get_volume() * 100),
+            self.playlist.shuffle_enabled,
+            self.playlist.repeat_mode.value,
+            self.size.width,
+        )
+        if key != self._last_render_key:
+            self._last_render_key = key
+            self.refresh()
+
+    def _new_text(self) -> Text:
+        """Create an empty line that honours the widget's text-align.
+
+        A Group of Texts is not aligned by Textual, so each line carries the
+        justification itself.
+        """
+        text_align = self.styles.text_align
+        return Text(justify=JUSTIFY_METHODS.get(text_align))
 
-    def render(self) -> Text:
-        """Render the player controls.
+    def _build_header(self, current_track) -> Text:
+        """Build the track info lines shown above the progress bar.
+
+        Args:
+            current_track: Current track, or None
 
         Returns:
-            Rich Text with player information
+            Rich Text with the track info lines
         """
-        result = Text()
+        result = self._new_text()
 
         # Current track info (top line)
-        current_track = self.playlist.get_current_track()
         if current_track:
             # Main track info
             track_info = f"♫ {current_track.artist} - {current_track.title}"
@@ -88,20 +150,29 @@ class PlayerControls(Widget):
             if tech_parts:
                 result.append("  " + " │ ".join(tech_parts), style="dim white")
         else:
-            result.append("No track loaded", style="dim")
+            result.append(NO_TRACK_TEXT)
 
-        result.append("\n\n")
+        return result
+
+    def _build_progress(self, position: float, duration: float, progress: float, bar_width: int) -> Text:
+        """Build the time and progress bar line.
+
+        Args:
+            position: Current position in seconds
+            duration: Track duration in seconds
+            progress: Playback progress (0.0-1.0)
+            bar_width: Width of the bar in cells
+
+        Returns:
+            Rich Text with the progress line
+        """
+        result = self._new_text()
 
         # Time info
-        position = self.player.get_position()
-        duration = self.player.get_duration()
         time_start = format_time(position)
         time_end = format_time(duration)
 
         # Large progress bar with percentage
-        progress = self.player.get_progress()
-        # Use full width minus some padding
-        bar_width = max(60, self.size.width - 30) if self.size.width > 30 else 40
         filled = int(progress * bar_width)
         empty = bar_width - filled
 
@@ -112,10 +183,22 @@ class PlayerControls(Widget):
         result.append(" " + time_end, style="cyan")
         result.append(f" ({int(progress * 100)}%)", style="yellow")
 
-        result.append("\n\n")
+        return result
+
+    def _build_controls(self, playing: bool, volume: float) -> Text:
+        """Build the transport, volume and mode line.
+
+        Args:
+            playing: Whether playback is running (not paused)
+            volume: Volume level (0.0-1.0)
+
+        Returns:
+            Rich Text with the controls line
+        """
+        result = self._new_text()
 
         # Playback controls line
-        if self.player.is_playing and not self.player.is_paused:
+        if playing:
             play_symbol = "⏸ "
             play_style = "bold yellow"
         else:
@@ -127,7 +210,6 @@ class PlayerControls(Widget):
         result.append("⏭  ", style="bold white")
 
         # Volume bar
-        volume = self.player.get_volume()
         volume_width = 20
         vol_filled = int(volume * volume_width)
         vol_empty = volume_width - vol_filled
@@ -150,6 +232,62 @@ class PlayerControls(Widget):
             result.append("  │  " + " ".join(mode_parts), style="bold blue")
 
         # Lyrics toggle info
-        result.append("  │  📜 Lyrics (l)", style="bold purple")
+        result.append(LYRICS_HINT_TEXT)
 
         return result
+
+    def render(self) -> Group:
+        """Render the player controls.
+
+        Each line is a separate Text that is only rebuilt when its own
+        inputs change.
+
+        Returns:
+            Rich Group with player information
+        """
+        # Track info only changes with the track or its metadata (e.g. after
+        # Spotify enrichment), so reuse the last header
+        current_track = self.playlist.get_current_track()
+        header_key = (
+            (
+                id(current_track),
+                current_track.file_path,
+                current_track.artist,
+                current_track.title,
+                current_track.album,
+                current_track.track_number,
+                current_track.year,
+                current_track.genre,
+                current_track.bitrate,
+                current_track.sample_rate,
+                current_track.channels,
+            )
+            if current_track else None
+        )
+        if header_key != self._header_key:
+            self._header_key = header_key
+            self._header_text = self._build_header(current_track)
+
+        position = self.player.get_position()
+        duration = self.player.get_duration()
+        progress = self.player.get_progress()
+        bar_width = self._progress_bar_width()
+        progress_key = (int(position), int(duration), int(progress * bar_width), int(progress * 100), bar_width)
+        if progress_key != self._progress_key:
+            self._progress_key = progress_key
+            self._progress_text = self._build_progress(position, duration, progress, bar_width)
+
+        playing = self.player.is_playing and not self.player.is_paused
+        volume = self.player.get_volume()
+        controls_key = (playing, int(volume * 100), self.playlist.shuffle_enabled, self.playlist.repeat_mode.value)
+        if controls_key != self._controls_key:
+            self._controls_key = controls_key
+            self._controls_text = self._build_controls(playing, volume)
+
+        return Group(
+            self._header_text,
+            BLANK_TEXT,
+            self._progress_text,
+            BLANK_TEXT,
+            self._controls_text,
+        )
@@ -1,12 +1,165 @@
 """Playlist view widget."""
 
+from typing import Optional
+
+from rich.style import Style
+from rich.text import Text
+from textual.binding import Binding
+from textual.geometry import Region, Size
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
 from textual.widget import Widget
-from textual.widgets import ListView, ListItem, Label
+from textual.widgets import Label
 from textual.reactive import reactive
 from textual.message import Message
 
 from muker.core.playlist import PlaylistManager
 from muker.models.track import Track
+from muker.ui.messages import UITick
+
+
+class PlaylistList(ScrollView, can_focus=True):
+    """Virtualized track list.
+
+    Rows are drawn on demand with the line API, so only the visible tracks
+    are formatted and the widget count stays constant however long the
+    playlist gets.
+    """
+
+    COMPONENT_CLASSES = {
+        "playlist-list--cursor",
+        "playlist-list--hover",
+    }
+
+    BINDINGS = [
+        Binding("enter", "select_cursor", "Select", show=False),
+        Binding("up", "cursor_up", "Cursor Up", show=False),
+        Binding("down", "cursor_down", "Cursor Down", show=False),
+        Binding("pageup", "page_up", "Page Up", show=False),
+        Binding("pagedown", "page_down", "Page Down", show=False),
+        Binding("home", "first", "First", show=False),
+        Binding("end", "last", "Last", show=False),
+    ]
+
+    cursor: reactive[int] = reactive(0)
+
+    CURRENT_STYLE = Style(color="cyan", bold=True)
+
+    class Selected(Message):
+        """Message sent when a row is chosen with enter or a click."""
+
+        def __init__(self, index: int):
+            super().__init__()
+            self.index = index
+
+    def __init__(self, playlist: PlaylistManager, id: Optional[str] = None):
+        """Initialize the track list.
+
+        Args:
+            playlist: Playlist manager instance
+            id: Widget ID
+        """
+        super().__init__(id=id)
+        self.playlist = playlist
+        self._hover_row = -1
+
+    def refresh_tracks(self):
+        """Resize the scrollable area to the playlist and repaint."""
+        self.virtual_size = Size(0, len(self.playlist.tracks))
+        if self.cursor >= len(self.playlist.tracks):
+            self.cursor = max(0, len(self.playlist.tracks) - 1)
+        self.refresh()
+
+    def _format_track(self, index: int, track: Track, is_current: bool) -> str:
+        """Build the display text for a playlist entry."""
+        # Mark current track
+        marker = "▶ " if is_current else "  "
+
+        return f"{marker}{index+1}. {track.display_line}"
+
+    def render_line(self, y: int) -> Strip:
+        """Render one visible row of the playlist."""
+        scroll_x, scroll_y = self.scroll_offset
+        index = scroll_y + y
+        width = self.size.width
+        base_style = self.rich_style
+        tracks = self.playlist.tracks
+
+        if not tracks:
+            text = Text(" No tracks loaded" if y == 0 else "", style=base_style)
+            return Strip(text.render(self.app.console)).crop_extend(0, width, base_style)
+        if index >= len(tracks):
+            return Strip.blank(width, base_style)
+
+        row_style = base_style
+        if index == self.cursor and self.has_focus:
+            row_style += self.get_component_rich_style("playlist-list--cursor")
+        elif index == self._hover_row:
+            row_style += self.get_component_rich_style("playlist-list--hover")
+
+        is_current = (index == self.playlist.current_index)
+        text = Text(" " + self._format_track(index, tracks[index], is_current), style=row_style)
+        if is_current:
+            text.stylize(self.CURRENT_STYLE)
+
+        strip = Strip(text.render(self.app.console))
+        return strip.crop_extend(scroll_x, scroll_x + width, row_style)
+
+    def watch_cursor(self, old_cursor: int, cursor: int):
+        """Keep the cursor row in view."""
+        self.scroll_to_region(Region(0, cursor, max(1, self.size.width), 1), animate=False)
+        self.refresh()
+
+    def on_focus(self):
+        """Show the cursor row while focused."""
+        self.refresh()
+
+    def on_blur(self):
+        """Hide the cursor row when focus leaves."""
+        self.refresh()
+
+    def on_mouse_move(self, event):
+        """Track the hovered row."""
+        row = event.y + self.scroll_offset.y
+        if row != self._hover_row:
+            self._hover_row = row
+            self.refresh()
+
+    def on_leave(self, event):
+        """Clear hover highlight."""
+        self._hover_row = -1
+        self.refresh()
+
+    def on_click(self, event):
+        """Select the clicked row."""
+        row = event.y + self.scroll_offset.y
+        if 0 <= row < len(self.playlist.tracks):
+            self.cursor = row
+            self.post_message(self.Selected(row))
+
+    def action_select_cursor(self):
+        """Select the row under the cursor."""
+        if 0 <= self.cursor < len(self.playlist.tracks):
+            self.post_message(self.Selected(self.cursor))
+
+    def action_cursor_up(self):
+        self.cursor = max(0, self.cursor - 1)
+
+    def action_cursor_down(self):
+        self.cursor = max(0, min(len(self.playlist.tracks) - 1, self.cursor + 1))
+
+    def action_page_up(self):
+        self.cursor = max(0, self.cursor - max(1, self.size.height))
+
+    def action_page_down(self):
+        last = max(0, len(self.playlist.tracks) - 1)
+        self.cursor = min(last, self.cursor + max(1, self.size.height))
+
+    def action_first(self):
+        self.cursor = 0
+
+    def action_last(self):
+        self.cursor = max(0, len(self.playlist.tracks) - 1)
 
 
 class PlaylistView(Widget):
@@ -31,65 +184,55 @@ class PlaylistView(Widget):
         """
         super().__init__()
         self.playlist = playlist
+        self._last_state = None
 
     def compose(self):
         """Create the playlist view layout."""
         yield Label("Playlist", id="playlist-title")
-        yield ListView(id="playlist-list")
+        yield PlaylistList(self.playlist, id="playlist-list")
 
     def on_mount(self):
         """Called when widget is mounted."""
-        self.track_count = len(self.playlist.tracks)
         self.update_playlist()
-        # Refresh periodically to check for updates
-        self.set_interval(0.1, self.check_updates)
+
+    def on_uitick(self, message: UITick):
+        """Check for playlist updates every other UI tick."""
+        if message.count % 2 == 0:
+            self.check_updates()
+
+    def _playlist_state(self) -> tuple:
+        """Cheap fingerprint of what the list displays."""
+        tracks = self.playlist.tracks
+        return (
+            id(tracks),
+            len(tracks),
+            self.playlist.current_index,
+            id(tracks[0]) if tracks else None,
+            id(tracks[-1]) if tracks else None,
+        )
 
     def check_updates(self):
-        """Check if playlist has been updated."""
-        current_count = len(self.playlist.tracks)
-        current_idx = self.playlist.current_index
+        """Check if playlist has been updated.
 
-        if current_count != self.track_count or current_idx != self.current_index:
-            self.track_count = current_count
-            self.current_index = current_idx
+        Only the visible rows are drawn, so any change simply repaints the
+        list; no per-track widgets are created or destroyed.
+        """
+        if self._playlist_state() != self._last_state:
             self.update_playlist()
 
     def update_playlist(self):
         """Update the playlist display."""
-        list_view = self.query_one("#playlist-list", ListView)
-        list_view.clear()
-
-        if not self.playlist.tracks:
-            list_view.append(ListItem(Label("No tracks loaded")))
-            return
-
-        for i, track in enumerate(self.playlist.tracks):
-            # Mark current track
-            is_current = (i == self.playlist.current_index)
-            marker = "▶ " if is_current else "  "
-
-            # Format track info
-            track_text = f"{marker}{i+1}. {track.artist} - {track.title}"
-            if track.duration > 0:
-                track_text += f" ({track.format_duration()})"
-
-            label = Label(track_text)
-            if is_current:
-                label.styles.color = "cyan"
-                label.styles.text_style = "bold"
-
-            list_view.append(ListItem(label))
+        self._last_state = self._playlist_state()
+        self.track_count = len(self.playlist.tracks)
+        self.current_index = self.playlist.current_index
+        self.query_one("#playlist-list", PlaylistList).refresh_tracks()
 
-    def on_list_view_selected(self, event: ListView.Selected) -> None:
+    def on_playlist_list_selected(self, event: PlaylistList.Selected) -> None:
         """Handle track selection from the list."""
-        if not self.playlist.tracks:
-            return
-
-        # Get the selected index
-        selected_index = event.list_view.index
+        selected_index = event.index
 
-        # Check if it's a valid track (not the "No tracks loaded" message)
-        if selected_index is not None and 0 <= selected_index < len(self.playlist.tracks):
+        # Check if it's a valid track
+        if 0 <= selected_index < len(self.playlist.tracks):
             track = self.playlist.tracks[selected_index]
             # Update playlist current index
             self.playlist.set_current_index(selected_index)
@@ -1,9 +1,15 @@
 """Custom progress bar widget for seeking."""
 
+from typing import Optional
+
 from textual.widget import Widget
 from textual.reactive import reactive
 from rich.text import Text
 
+# Pre-built bar strings; rendering slices these instead of repeating chars
+BAR_FILLED = "█" * 512
+BAR_EMPTY = "─" * 512
+
 
 class ProgressBar(Widget):
     """Interactive progress bar for track seeking."""
@@ -11,9 +17,11 @@ class ProgressBar(Widget):
     progress: reactive[float] = reactive(0.0)
     duration: reactive[float] = reactive(0.0)
 
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize progress bar."""
         super().__init__()
+        self._last_key: Optional[tuple] = None
+        self._last_text: Text = Text("")
 
     def render(self) -> Text:
         """Render the progress bar.
@@ -29,16 +37,26 @@ class ProgressBar(Widget):
         filled_width = int(self.progress * width)
         empty_width = width - filled_width
 
-        # Create bar
-        bar = "█" * filled_width + "─" * empty_width
-
         # Format time
         current_time = int(self.progress * self.duration)
         total_time = int(self.duration)
 
+        # Reuse the previous Text if nothing visible changed
+        key = (filled_width, current_time, total_time, width)
+        if key == self._last_key:
+            return self._last_text
+
+        # Create bar
+        if width <= len(BAR_FILLED):
+            bar = BAR_FILLED[:filled_width] + BAR_EMPTY[:empty_width]
+        else:
+            bar = "█" * filled_width + "─" * empty_width
+
         time_str = f" {current_time // 60:02d}:{current_time % 60:02d} / {total_time // 60:02d}:{total_time % 60:02d}"
 
         result = Text(bar + time_str)
+        self._last_key = key
+        self._last_text = result
         return result
 
     def set_progress(self, position: float, duration: float):
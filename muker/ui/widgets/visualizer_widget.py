@@ -1,33 +1,135 @@
 """Visualizer widget for displaying audio visualization."""
 
+import logging
+import time
+
 from textual.widget import Widget
 from textual.strip import Strip
 from textual.geometry import Size
 from textual import events
+from rich.style import Style
 from rich.text import Text
 from rich.segment import Segment
+from typing import List, Optional
 
 from muker.core.visualizer import AudioVisualizer, VisualizerStyle
 import numpy as np
 
+log = logging.getLogger(__name__)
+
+# Cell characters indexed by a boolean "filled" mask
+SPECTRUM_CHARS = np.array([' ', '█'])
+
+# Block characters indexed by how many eighths of the cell are filled
+BAR_CHARS = np.array([' ', '▁', '▂', '▃', '▄', '▅', '▆', '▇', '█'])
+
+
+def _grid_to_lines(grid: np.ndarray) -> List[str]:
+    """Join each row of a 2-D single-character array into a string.
+
+    Args:
+        grid: Array of shape (rows, columns) with dtype '<U1'
+
+    Returns:
+        List of row strings
+    """
+    rows, columns = grid.shape
+    if columns == 0:
+        return [""] * rows
+    lines: List[str] = np.ascontiguousarray(grid).view(f'<U{columns}').ravel().tolist()
+    return lines
+
 
 class VisualizerWidget(Widget):
     """Widget that displays real-time audio visualization."""
 
-    def __init__(self, visualizer: AudioVisualizer):
+    # Lowest frame rate the backpressure in _tick will drop to
+    MIN_REFRESH_RATE = 5
+
+    def __init__(self, visualizer: AudioVisualizer, fps: int = 30):
         """Initialize visualizer widget.
 
         Args:
             visualizer: AudioVisualizer instance
+            fps: Target frame rate
         """
         super().__init__()
         self.visualizer = visualizer
-        self.refresh_rate = 30  # FPS
+        self.refresh_rate = max(1, int(fps))  # FPS
+        self._timer = None
+        # Moving average of render() wall time in milliseconds
+        self._render_ms = 0.0
+        # Row depths (height-1 .. 0) for the current height, reused every frame
+        self._row_depths = np.zeros((0, 1), dtype=np.int32)
+        self._columns = np.arange(0)
+        # Last VU meter levels and the Text rendered for them
+        self._vu_key: Optional[tuple] = None
+        self._vu_text = Text("")
+        # Signature of the last rendered frame and its Text
+        self._last_sig: Optional[tuple] = None
+        self._last_text = Text("")
+        # Spectrum frames are drawn as strips through render_line
+        self._strips_sig: Optional[tuple] = None
+        self._strips: Optional[List[Strip]] = None
+        # Signature of whatever frame is currently on screen
+        self._shown_sig: Optional[tuple] = None
+        # Signature of the frame to paint, taken once per tick
+        self._frame_sig: Optional[tuple] = None
 
     def on_mount(self):
         """Called when widget is mounted."""
-        # Update at 30 FPS
-        self.set_interval(1/30, self.refresh)
+        self._start_timer()
+
+    def _start_timer(self):
+        """(Re)start the frame timer at the current refresh rate."""
+        if self._timer is not None:
+            self._timer.stop()
+        self._timer = self.set_interval(1 / self.refresh_rate, self._tick)
+
+    def on_resize(self, event: events.Resize):
+        """Drop the cached frame when the widget size changes."""
+        self._last_sig = None
+        self._strips_sig = None
+        self._shown_sig = None
+        self._frame_sig = None
+
+    def _tick(self):
+        """Repaint only if the visualization data changed (e.g. not while paused)."""
+        # Back off when frames take most of their budget, rather than letting
+        # timer callbacks pile up behind slow renders
+        budget_ms = 800 / self.refresh_rate
+        if self._render_ms > budget_ms and self.refresh_rate > self.MIN_REFRESH_RATE:
+            self.refresh_rate = max(self.MIN_REFRESH_RATE, self.refresh_rate // 2)
+            self._render_ms = 0.0
+            log.info("Visualizer render is slow, lowering to %d FPS", self.refresh_rate)
+            self._start_timer()
+
+        self._frame_sig = self._signature()
+        if self._frame_sig != self._shown_sig:
+            self.refresh()
+
+    def _signature(self) -> tuple:
+        """Cheap fingerprint of everything the current frame depends on."""
+        style = self.visualizer.get_style()
+        data: object
+        if style == VisualizerStyle.WAVEFORM:
+            data = self.visualizer.waveform_data.tobytes()
+        elif style == VisualizerStyle.VU_METER:
+            data = self.visualizer.get_vu_meter()
+        else:
+            data = self.visualizer.spectrum_data.tobytes()
+        return (style, self.size, self.styles.color, data)
+
+    def _frame_signature(self) -> tuple:
+        """Signature of the frame being painted.
+
+        Taken once per tick rather than per row, so render_line does not
+        copy and compare the visualization data for every line.
+        """
+        sig = self._frame_sig
+        if sig is None:
+            sig = self._frame_sig = self._signature()
+        return sig
 
     def render(self) -> Text:
         """Render the visualizer.
@@ -35,103 +137,165 @@ class VisualizerWidget(Widget):
         Returns:
             Rich Text with visualization
         """
-        style = self.visualizer.get_style()
+        sig = self._frame_signature()
+        self._shown_sig = sig
+        if sig == self._last_sig:
+            return self._last_text
 
-        if style == VisualizerStyle.SPECTRUM:
-            return self._render_spectrum()
-        elif style == VisualizerStyle.WAVEFORM:
-            return self._render_waveform()
+        style = sig[0]
+        start = time.perf_counter()
+
+        if style == VisualizerStyle.WAVEFORM:
+            result = self._render_waveform()
         elif style == VisualizerStyle.VU_METER:
-            return self._render_vu_meter()
+            result = self._render_vu_meter()
         elif style == VisualizerStyle.BARS:
-            return self._render_bars()
+            result = self._render_bars()
         else:
-            return self._render_spectrum()
+            # Spectrum frames with data are drawn by render_line
+            result = self._render_placeholder()
+
+        self._record_render_time(start)
+
+        self._last_sig = sig
+        self._last_text = result
+        return result
+
+    def _record_render_time(self, start: float):
+        """Fold the time since start into the render time average."""
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self._render_ms = 0.8 * self._render_ms + 0.2 * elapsed_ms
+
+    def render_line(self, y: int) -> Strip:
+        """Render one row of the widget.
+
+        The spectrum is drawn straight to strips; other styles and the
+        idle placeholder go through render(). Rows only index the strips
+        built for the current frame.
+        """
+        strips = self._spectrum_strips()
+        if strips is None:
+            return super().render_line(y)
+        if y < len(strips):
+            return strips[y]
+        return Strip.blank(self.size.width, self.rich_style)
 
-    def _render_spectrum(self) -> Text:
-        """Render frequency spectrum visualization."""
+    def _spectrum_strips(self) -> Optional[List[Strip]]:
+        """Get the strips for the current spectrum frame, building them if needed.
+
+        Returns:
+            One Strip per row, or None when render() should draw the frame
+        """
+        sig = self._frame_signature()
+        if sig[0] != VisualizerStyle.SPECTRUM:
+            return None
+
+        if sig is not self._strips_sig:
+            start = time.perf_counter()
+            self._strips = self._build_spectrum_strips()
+            self._strips_sig = sig
+            self._record_render_time(start)
+
+        if self._strips is not None:
+            self._shown_sig = sig
+        return self._strips
+
+    def _build_spectrum_strips(self) -> Optional[List[Strip]]:
+        """Build the spectrum rows as strips, centered in the widget."""
         width = self.size.width
         height = self.size.height
+        if width == 0 or height == 0:
+            return None
 
-        # Determine color from widget style or default
-        base_color = "cyan"
+        spectrum = self.visualizer.get_spectrum(min(width, 64))
+        if not spectrum.any():
+            return None
+
+        base_style = self.rich_style
+        bar_style = base_style + Style.parse(self._base_color())
+        padding = Segment(" " * ((width - len(spectrum)) // 2), base_style)
+
+        return [
+            Strip([padding, Segment(line, bar_style)]).crop_extend(0, width, base_style)
+            for line in self._spectrum_rows(spectrum, height)
+        ]
+
+    def _base_color(self) -> str:
+        """Name of the widget's text color, defaulting to cyan."""
         try:
             if self.styles.color:
-                base_color = self.styles.color.rich_color.name
+                return self.styles.color.rich_color.name
         except:
             pass
+        return "cyan"
 
-        if width == 0 or height == 0:
-            return Text("Visualizer", justify="center", style=f"bold {base_color}")
-
-        # Get spectrum data
-        spectrum = self.visualizer.get_spectrum(min(width, 64))
-
-        # If no audio data, show placeholder
-        if np.all(spectrum == 0):
-            lines = []
-            lines.append("\n" * (height // 2 - 1))
-
-            # Center align text manually
-            title = "♫ Audio Visualizer ♫"
-            style_text = f"Style: {self.visualizer.get_style().value}"
-            help_text = "Press 'v' to change style"
-
-            # Calculate padding for centering
-            padding_title = (width - len(title)) // 2 if width > len(title) else 0
-            padding_style = (width - len(style_text)) // 2 if width > len(style_text) else 0
-            padding_help = (width - len(help_text)) // 2 if width > len(help_text) else 0
-
-            result = Text()
-            result.append("\n" * (height // 2 - 1))
-            result.append(" " * padding_title)
-            result.append(title, style=f"bold {base_color}")
-            result.append("\n")
-            result.append(" " * padding_style)
-            result.append(style_text, style=f"dim {base_color}")
-            result.append("\n")
-            result.append(" " * padding_help)
-            result.append(help_text, style="dim")
-            return result
+    def _get_row_depths(self, height: int) -> np.ndarray:
+        """Get a (height, 1) column of row depths counted from the bottom.
 
-        lines = []
-        bar_chars = [' ', ' ', '▂', '▃', '▄', '▅', '▆', '▇', '█']
+        Args:
+            height: Number of rows
 
-        # Create bars for each frequency bin
-        for row in range(height):
-            line_parts = []
-            for i, value in enumerate(spectrum):
-                # Calculate bar height for this position
-                bar_height = int(value * height)
+        Returns:
+            Column vector [height-1, ..., 1, 0]
+        """
+        if len(self._row_depths) != height:
+            self._row_depths = np.arange(height - 1, -1, -1, dtype=np.int32)[:, None]
+        return self._row_depths
+
+    def _get_columns(self, width: int) -> np.ndarray:
+        """Get the column indices [0, width), reused every frame."""
+        if len(self._columns) != width:
+            self._columns = np.arange(width)
+        return self._columns
+
+    def _render_placeholder(self) -> Text:
+        """Render the idle screen shown before there is spectrum data."""
+        width = self.size.width
+        height = self.size.height
 
-                # Determine which character to use
-                if (height - row - 1) < bar_height:
-                    char = '█'
-                    color = base_color
-                else:
-                    char = ' '
-                    color = "white"
+        # Determine color from widget style or default
+        base_color = self._base_color()
 
-                line_parts.append((char, color))
+        if width == 0 or height == 0:
+            return Text("Visualizer", justify="center", style=f"bold {base_color}")
 
-            line_text = Text()
-            for char, color in line_parts:
-                line_text.append(char, style=color)
+        # Center align text manually
+        title = "♫ Audio Visualizer ♫"
+        style_text = f"Style: {self.visualizer.get_style().value}"
+        help_text = "Press 'v' to change style"
 
-            lines.append(line_text)
+        # Calculate padding for centering
+        padding_title = (width - len(title)) // 2 if width > len(title) else 0
+        padding_style = (width - len(style_text)) // 2 if width > len(style_text) else 0
+        padding_help = (width - len(help_text)) // 2 if width > len(help_text) else 0
 
-        # Combine lines
         result = Text()
-        for i, line in enumerate(lines):
-            result.append(line)
-            if i < len(lines) - 1:
-                result.append("\n")
+        result.append("\n" * (height // 2 - 1))
+        result.append(" " * padding_title)
+        result.append(title, style=f"bold {base_color}")
+        result.append("\n")
+        result.append(" " * padding_style)
+        result.append(style_text, style=f"dim {base_color}")
+        result.append("\n")
+        result.append(" " * padding_help)
+        result.append(help_text, style="dim")
+        return result
 
-        # Add style name in corner
-        style_name = f" [{self.visualizer.get_style().value}] "
-        result.stylize(f"bold {base_color}", len(str(result)) - len(style_name), len(str(result)))
+    def _spectrum_rows(self, spectrum: np.ndarray, height: int) -> list:
+        """Draw spectrum bars as rows of block characters.
 
-        return result
+        Args:
+            spectrum: Bar levels in 0-1
+            height: Number of rows
+
+        Returns:
+            List of row strings, top row first
+        """
+        # Bar heights in eighths of a cell; each cell shows the 0-8 eighths
+        # that reach past its depth from the bottom
+        bar_eighths = (spectrum * (height * 8)).astype(np.int32)
+        eighths = np.clip(bar_eighths[None, :] - self._get_row_depths(height) * 8, 0, 8)
+        return _grid_to_lines(BAR_CHARS[eighths])
 
     def _render_waveform(self) -> Text:
         """Render waveform visualization."""
@@ -144,25 +308,17 @@ class VisualizerWidget(Widget):
         # Get waveform data
         waveform = self.visualizer.get_waveform(width)
 
-        lines = []
         mid_point = height // 2
 
-        for row in range(height):
-            line = ""
-            for i, value in enumerate(waveform):
-                # Map value (-1 to 1) to row position
-                wave_row = mid_point - int(value * mid_point)
+        # Map values (-1 to 1) to row positions, pinning peaks to the edges
+        wave_rows = mid_point - (waveform * mid_point).astype(np.int32)
+        np.clip(wave_rows, 0, height - 1, out=wave_rows)
 
-                if row == wave_row:
-                    line += "█"
-                elif row == mid_point:
-                    line += "─"
-                else:
-                    line += " "
+        grid = np.full((height, len(waveform)), ' ', dtype='<U1')
+        grid[mid_point, :] = '─'
+        grid[wave_rows, self._get_columns(len(waveform))] = '█'
 
-            lines.append(line)
-
-        result = Text("\n".join(lines), style="bright_green")
+        result = Text("\n".join(_grid_to_lines(grid)), style="bright_green")
         return result
 
     def _render_vu_meter(self) -> Text:
@@ -175,13 +331,18 @@ class VisualizerWidget(Widget):
 
         left, right = self.visualizer.get_vu_meter()
 
-        lines = []
-
         # Calculate bar widths
         bar_width = min(width - 10, 50)  # Leave space for labels
         left_bar_len = int(left * bar_width)
         right_bar_len = int(right * bar_width)
 
+        # Levels change slowly, so the text is often identical to last frame
+        key = (height, bar_width, left_bar_len, right_bar_len, int(left * 100), int(right * 100))
+        if key == self._vu_key:
+            return self._vu_text
+
+        lines = []
+
         # Add some spacing at top
         for _ in range(height // 3):
             lines.append("")
@@ -197,6 +358,8 @@ class VisualizerWidget(Widget):
         lines.append(f"R: {right_bar} {int(right * 100):3d}%")
 
         result = Text("\n".join(lines), style="yellow")
+        self._vu_key = key
+        self._vu_text = result
         return result
 
     def _render_bars(self) -> Text:
@@ -210,18 +373,10 @@ class VisualizerWidget(Widget):
         # Get bar data (fewer bins for cleaner look)
         bars = self.visualizer.get_bars(min(width // 2, 32))
 
-        lines = []
-
-        for row in range(height):
-            line = ""
-            for value in bars:
-                bar_height = int(value * height)
-                if (height - row - 1) < bar_height:
-                    line += "██"
-                else:
-                    line += "  "
-
-            lines.append(line)
+        # Same mask as the spectrum, with every bar two cells wide
+        bar_heights = (bars * height).astype(np.int32)
+        filled = self._get_row_depths(height) < bar_heights[None, :]
+        grid = SPECTRUM_CHARS[np.repeat(filled, 2, axis=1).view(np.uint8)]
 
-        result = Text("\n".join(lines), style="magenta")
+        result = Text("\n".join(_grid_to_lines(grid)), style="magenta")
         return result
\ No newline at end of file
@@ -1,14 +1,67 @@
 """Audio utility functions."""
 
+import math
+from functools import lru_cache
 import numpy as np
-from typing import Tuple
-
-
-def normalize_pcm_data(pcm_data: np.ndarray) -> np.ndarray:
+from typing import Optional, Tuple, Union
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# 10 ** (db / 20) == exp(db * ln(10) / 20)
+_LN10_OVER_20 = math.log(10.0) / 20.0
+
+
+if NUMBA_AVAILABLE:
+    # Fused single-pass float32 kernels for the per-frame visualizer path.
+    # Compiled on first use and cached on disk.
+
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def _normalize_f32(x, out):
+        peak = 0.0
+        for i in range(x.shape[0]):
+            v = abs(x[i])
+            if v > peak:
+                peak = v
+        if peak > 0.0:
+            scale = 1.0 / peak
+            for i in range(x.shape[0]):
+                out[i] = x[i] * scale
+        else:
+            for i in range(x.shape[0]):
+                out[i] = x[i]
+        return peak
+
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def _rms_f32(x):
+        acc = 0.0
+        for i in range(x.shape[0]):
+            v = np.float64(x[i])
+            acc += v * v
+        return np.sqrt(acc / x.shape[0])
+
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def _stereo_to_mono_f32(x, out):
+        for i in range(x.shape[0]):
+            out[i] = (x[i, 0] + x[i, 1]) * np.float32(0.5)
+        return out
+
+
+def _use_kernel(pcm_data: np.ndarray, ndim: int) -> bool:
+    """Whether a Numba float32 kernel can handle this array."""
+    return NUMBA_AVAILABLE and pcm_data.dtype == np.float32 and pcm_data.ndim == ndim
+
+
+def normalize_pcm_data(pcm_data: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
     """Normalize PCM data to range [-1.0, 1.0].
 
     Args:
         pcm_data: Raw PCM data
+        out: Optional float array to write the result into (may be pcm_data
+            itself for in-place normalization)
 
     Returns:
         Normalized PCM data
@@ -16,26 +69,50 @@ def normalize_pcm_data(pcm_data: np.ndarray) -> np.ndarray:
     if pcm_data.size == 0:
         return pcm_data
 
-    max_val = np.abs(pcm_data).max()
+    if _use_kernel(pcm_data, 1) and (out is None or out.dtype == np.float32):
+        if out is None:
+            out = np.empty_like(pcm_data)
+        _normalize_f32(pcm_data, out)
+        return out
+
+    # Peak magnitude from two reductions, without an abs() temporary.
+    # Python floats avoid overflow when negating e.g. int16 -32768.
+    hi = float(pcm_data.max())
+    lo = float(pcm_data.min())
+    max_val = hi if hi > -lo else -lo
+
     if max_val > 0:
+        if out is not None:
+            return np.multiply(pcm_data, 1.0 / max_val, out=out)
         return pcm_data / max_val
+    if out is not None:
+        np.copyto(out, pcm_data)
+        return out
     return pcm_data
 
 
-def stereo_to_mono(pcm_data: np.ndarray) -> np.ndarray:
+def stereo_to_mono(pcm_data: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
     """Convert stereo PCM data to mono by averaging channels.
 
     Args:
         pcm_data: Stereo PCM data with shape (samples, 2)
+        out: Optional float32 buffer of shape (samples,) to reuse
 
     Returns:
-        Mono PCM data with shape (samples,)
+        Mono PCM data with shape (samples,), float32 for stereo input
     """
     if pcm_data.ndim == 1:
         return pcm_data
 
     if pcm_data.ndim == 2 and pcm_data.shape[1] == 2:
-        return np.mean(pcm_data, axis=1)
+        # Add in float32 (no float64 upcast, no int16 overflow), then halve
+        if out is None:
+            out = np.empty(pcm_data.shape[0], dtype=np.float32)
+        if _use_kernel(pcm_data, 2):
+            return _stereo_to_mono_f32(pcm_data, out)
+        np.add(pcm_data[:, 0], pcm_data[:, 1], out=out, dtype=np.float32)
+        out *= 0.5
+        return out
 
     return pcm_data
 
@@ -52,19 +129,33 @@ def calculate_rms(pcm_data: np.ndarray) -> float:
     if pcm_data.size == 0:
         return 0.0
 
-    return float(np.sqrt(np.mean(np.square(pcm_data))))
+    if _use_kernel(pcm_data, 1):
+        return float(_rms_f32(pcm_data))
+
+    # Sum of squares as a dot product: no squared temporary. Integer PCM is
+    # converted first so the accumulation cannot overflow.
+    if pcm_data.dtype.kind != 'f':
+        pcm_data = pcm_data.astype(np.float64)
+    flat = pcm_data.reshape(-1)
+    return float(np.sqrt(np.dot(flat, flat) / flat.size))
 
 
-def db_to_linear(db: float) -> float:
+def db_to_linear(
+    db: Union[float, np.ndarray],
+    out: Optional[np.ndarray] = None
+) -> Union[float, np.ndarray]:
     """Convert decibels to linear scale.
 
     Args:
-        db: Decibel value
+        db: Decibel value or array of values
+        out: Optional output array for array input
 
     Returns:
-        Linear scale value
+        Linear scale value (an array for array input)
     """
-    return 10.0 ** (db / 20.0)
+    if isinstance(db, np.ndarray):
+        return np.exp(db * _LN10_OVER_20, out=out)
+    return math.exp(db * _LN10_OVER_20)
 
 
 def linear_to_db(linear: float) -> float:
@@ -78,7 +169,17 @@ def linear_to_db(linear: float) -> float:
     """
     if linear <= 0:
         return -float('inf')
-    return 20.0 * np.log10(linear)
+    return 20.0 * math.log10(linear)
+
+
+@lru_cache(maxsize=4096)
+def _format_seconds(seconds: int) -> str:
+    """Format a whole number of seconds (cached, values repeat every frame)."""
+    hours, rem = divmod(seconds, 3600)
+    minutes, secs = divmod(rem, 60)
+    if hours:
+        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+    return f"{minutes:02d}:{secs:02d}"
 
 
 def format_time(seconds: float) -> str:
@@ -90,11 +191,4 @@ def format_time(seconds: float) -> str:
     Returns:
         Formatted time string
     """
-    seconds = int(seconds)
-    hours = seconds // 3600
-    minutes = (seconds % 3600) // 60
-    secs = seconds % 60
-
-    if hours > 0:
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
-    return f"{minutes:02d}:{secs:02d}"
+    return _format_seconds(int(seconds))
@@ -1,9 +1,31 @@
 """Configuration management for Muker."""
 
+import asyncio
 import json
+from collections import ChainMap
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize config to indented UTF-8 JSON."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse JSON written by _dumps (or by hand)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 class Config:
     """Manages application configuration."""
@@ -18,6 +40,9 @@ class Config:
         'autoplay': False
     }
 
+    # Delay used by save_later to coalesce bursts of changes into one write
+    SAVE_DELAY = 1.0
+
     def __init__(self, config_path: Optional[Path] = None):
         """Initialize configuration manager.
 
@@ -29,7 +54,12 @@ class Config:
         else:
             self.config_path = config_path
 
-        self.config: Dict[str, Any] = self.DEFAULT_CONFIG.copy()
+        # Only settings that differ from the defaults are stored and saved;
+        # lookups fall through to DEFAULT_CONFIG
+        self._overrides: Dict[str, Any] = {}
+        self.config: ChainMap = ChainMap(self._overrides, self.DEFAULT_CONFIG)
+        self._dirty = False
+        self._save_handle: Optional[asyncio.TimerHandle] = None
         self.load()
 
     def load(self):
@@ -41,21 +71,47 @@ class Config:
             return
 
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                loaded_config = json.load(f)
-                self.config.update(loaded_config)
-        except (json.JSONDecodeError, IOError) as e:
+            loaded_config = _loads(self.config_path.read_bytes())
+            self._overrides.update(loaded_config)
+        except (json.JSONDecodeError, IOError) as e:  # orjson's error subclasses json's
             print(f"Warning: Could not load config: {e}. Using defaults.")
 
     def save(self):
         """Save configuration to file."""
+        self._cancel_pending_save()
         try:
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
+            self.config_path.write_bytes(_dumps(self._overrides))
+            self._dirty = False
         except IOError as e:
             print(f"Warning: Could not save config: {e}")
 
+    def save_later(self):
+        """Save after SAVE_DELAY seconds, coalescing repeated calls.
+
+        Falls back to saving immediately when no event loop is running.
+        """
+        if self._save_handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.save()
+            return
+        self._save_handle = loop.call_later(self.SAVE_DELAY, self.flush)
+
+    def flush(self):
+        """Write pending changes, if any."""
+        self._save_handle = None
+        if self._dirty:
+            self.save()
+
+    def _cancel_pending_save(self):
+        """Drop a scheduled save_later write."""
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+            self._save_handle = None
+
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value.
 
@@ -75,9 +131,11 @@ class Config:
             key: Configuration key
             value: Value to set
         """
-        self.config[key] = value
+        if key not in self.config or self.config[key] != value:
+            self._overrides[key] = value
+            self._dirty = True
 
     def reset(self):
         """Reset configuration to defaults."""
-        self.config = self.DEFAULT_CONFIG.copy()
+        self._overrides.clear()
         self.save()
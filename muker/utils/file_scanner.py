@@ -1,15 +1,41 @@
 """File scanner utility for finding music files."""
 
 import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Set, Optional, Any
+from typing import AsyncIterator, Callable, Iterator, List, Set, Optional, Any, Tuple, Union
 from mutagen import File as MutagenFile
-from mutagen.mp3 import MP3
+from mutagen.mp3 import MP3, EasyMP3
 from mutagen.flac import FLAC
 from mutagen.oggvorbis import OggVorbis
 from mutagen.wave import WAVE
 
-from muker.models.track import Track
+from muker.models.track import Track, UNKNOWN_ARTIST, UNKNOWN_ALBUM
+
+# Track fields that come from the file's tags and stream info
+_CACHED_FIELDS = (
+    'title', 'artist', 'album', 'duration', 'track_number', 'year',
+    'genre', 'bitrate', 'sample_rate', 'channels',
+)
+
+
+# Open known formats with their reader directly instead of letting
+# MutagenFile score every format. EasyMP3 keeps the plain tag keys
+# ('title', 'artist', ...) that easy=True gave.
+_READERS = {
+    '.mp3': EasyMP3,
+    '.flac': FLAC,
+    '.ogg': OggVorbis,
+    '.wav': WAVE,
+}
+
+
+def _first(tags, key: str, default: Any) -> Any:
+    """Return the first value of a tag, or default when it is missing."""
+    values = tags.get(key)
+    return values[0] if values else default
 
 
 class FileScanner:
@@ -18,9 +44,24 @@ class FileScanner:
     # Supported audio file extensions
     SUPPORTED_EXTENSIONS: Set[str] = {'.mp3', '.wav', '.flac', '.ogg'}
 
+    # Same extensions without the dot, for matching DirEntry names
+    _EXTENSIONS_NO_DOT = frozenset(ext[1:] for ext in SUPPORTED_EXTENSIONS)
+
     # Spotify service instance (shared across scans)
     _spotify_service: Optional[Any] = None
 
+    # Metadata cache (DatabaseManager) used to skip re-parsing unchanged files
+    _metadata_cache: Optional[Any] = None
+
+    # Maximum number of Spotify lookups in flight during a scan
+    SPOTIFY_CONCURRENCY: int = 8
+
+    # Threads used to read tags; mutagen spends most of its time waiting on disk
+    SCAN_WORKERS: int = min(32, (os.cpu_count() or 1) * 4)
+
+    # Tracks per batch yielded by scan_directory_iter
+    SCAN_BATCH_SIZE: int = 32
+
     @classmethod
     def set_spotify_service(cls, service):
         """Set Spotify service for metadata enrichment.
@@ -30,6 +71,15 @@ class FileScanner:
         """
         cls._spotify_service = service
 
+    @classmethod
+    def set_metadata_cache(cls, cache):
+        """Set the cache used to reuse metadata of unchanged files.
+
+        Args:
+            cache: DatabaseManager instance
+        """
+        cls._metadata_cache = cache
+
     @staticmethod
     def is_supported(file_path: Path) -> bool:
         """Check if a file is a supported audio format.
@@ -43,7 +93,40 @@ class FileScanner:
         return file_path.suffix.lower() in FileScanner.SUPPORTED_EXTENSIONS
 
     @classmethod
-    def extract_metadata(cls, file_path: Path, enrich_with_spotify: bool = False) -> Track:
+    def _walk(cls, root: str, recursive: bool = True) -> Iterator[str]:
+        """Yield paths of supported files under root.
+
+        Uses os.scandir so file type and name come from the directory
+        listing itself instead of a stat per entry.
+
+        Args:
+            root: Directory to walk
+            recursive: Whether to descend into subdirectories
+
+        Yields:
+            File paths as strings
+        """
+        extensions = cls._EXTENSIONS_NO_DOT
+        stack = [root]
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive:
+                                stack.append(entry.path)
+                        elif (entry.name.rpartition('.')[2].lower() in extensions
+                              and entry.is_file()):
+                            yield entry.path
+                    except OSError:
+                        continue
+
+    @classmethod
+    def extract_metadata(cls, file_path: Union[str, Path], enrich_with_spotify: bool = False) -> Track:
         """Extract metadata from an audio file.
 
         Args:
@@ -52,20 +135,41 @@ class FileScanner:
         Returns:
             Track object with metadata
         """
+        return cls._read_metadata(file_path, enrich_with_spotify)[0]
+
+    @classmethod
+    def _read_metadata(cls, file_path: Union[str, Path],
+                       enrich_with_spotify: bool = False) -> Tuple[Track, bool]:
+        """Extract metadata, reporting whether reading the file succeeded.
+
+        Args:
+            file_path: Path to audio file
+            enrich_with_spotify: Whether to enrich the track from Spotify
+
+        Returns:
+            Tuple of (track, ok). When reading failed, track only has the
+            file name as title and ok is False, so it must not be cached.
+        """
+        file_path = str(file_path)
+        stem = os.path.splitext(os.path.basename(file_path))[0]
         try:
-            audio = MutagenFile(str(file_path), easy=True)
+            reader = _READERS.get(os.path.splitext(file_path)[1].lower())
+            if reader is not None:
+                audio = reader(file_path)
+            else:
+                audio = MutagenFile(file_path, easy=True)
 
             if audio is None:
-                # Fallback to basic track info
+                # Not a recognized audio file; fall back to basic track info
                 return Track(
-                    file_path=str(file_path),
-                    title=file_path.stem
-                )
+                    file_path=file_path,
+                    title=stem
+                ), True
 
             # Extract common metadata
-            title = file_path.stem
-            artist = "Unknown Artist"
-            album = "Unknown Album"
+            title = stem
+            artist = UNKNOWN_ARTIST
+            album = UNKNOWN_ALBUM
             duration = 0.0
             track_number = None
             year = None
@@ -75,34 +179,32 @@ class FileScanner:
             channels = None
 
             # Try to get metadata from tags
-            if hasattr(audio, 'tags') and audio.tags:
-                title = audio.tags.get('title', [title])[0] if 'title' in audio.tags else title
-                artist = audio.tags.get('artist', [artist])[0] if 'artist' in audio.tags else artist
-                album = audio.tags.get('album', [album])[0] if 'album' in audio.tags else album
-
-                if 'tracknumber' in audio.tags:
+            tags = audio.tags
+            if tags:
+                title = _first(tags, 'title', title)
+                artist = _first(tags, 'artist', artist)
+                album = _first(tags, 'album', album)
+
+                track_num = _first(tags, 'tracknumber', None)
+                if track_num is not None:
                     try:
-                        track_num_str = str(audio.tags['tracknumber'][0])
                         # Handle formats like "1/12"
-                        if '/' in track_num_str:
-                            track_num_str = track_num_str.split('/')[0]
-                        track_number = int(track_num_str)
-                    except (ValueError, IndexError):
+                        track_number = int(str(track_num).split('/')[0])
+                    except ValueError:
                         pass
 
-                if 'date' in audio.tags:
+                date = _first(tags, 'date', None)
+                if date is not None:
                     try:
-                        year_str = str(audio.tags['date'][0])[:4]
-                        year = int(year_str)
-                    except (ValueError, IndexError):
+                        year = int(str(date)[:4])
+                    except ValueError:
                         pass
 
-                if 'genre' in audio.tags:
-                    genre = audio.tags['genre'][0]
+                genre = _first(tags, 'genre', None)
 
             # Get audio info (duration, bitrate, sample rate, channels)
             if hasattr(audio, 'info'):
-                info = audio.info
+                info: Any = audio.info
 
                 # Duration
                 if hasattr(info, 'length'):
@@ -121,7 +223,7 @@ class FileScanner:
                     channels = int(info.channels)
 
             track = Track(
-                file_path=str(file_path),
+                file_path=file_path,
                 title=title,
                 artist=artist,
                 album=album,
@@ -137,59 +239,217 @@ class FileScanner:
             # Enrich with Spotify if requested and service is available
             if enrich_with_spotify and cls._spotify_service and cls._spotify_service.is_available():
                 # Enrich all tracks that have artist and title
-                if artist != "Unknown Artist" and title:
+                if artist != UNKNOWN_ARTIST and title:
                     track = cls._spotify_service.enrich_track(track)
 
-            return track
+            return track, True
 
         except Exception as e:
             # If metadata extraction fails, return basic track info
             print(f"[WARNING] Metadata extraction failed for {file_path}: {e}")
             return Track(
-                file_path=str(file_path),
-                title=file_path.stem
-            )
+                file_path=file_path,
+                title=stem
+            ), False
+
+    @classmethod
+    def _extract_all(cls, file_paths: List[str],
+                     executor: Optional[ThreadPoolExecutor] = None) -> List[Tuple[Track, bool]]:
+        """Extract metadata for many files on a thread pool.
+
+        Args:
+            file_paths: Supported audio files
+            executor: Pool to reuse; a temporary one is created if omitted
+
+        Returns:
+            (track, ok) pairs from _read_metadata, in the same order as
+            file_paths
+        """
+        if len(file_paths) <= 1:
+            return [cls._read_metadata(fp) for fp in file_paths]
+
+        if executor is not None:
+            return list(executor.map(cls._read_metadata, file_paths))
+
+        workers = min(cls.SCAN_WORKERS, len(file_paths))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="muker-scan") as executor:
+            return list(executor.map(cls._read_metadata, file_paths))
+
+    @classmethod
+    def _load_tracks(cls, file_paths: List[str],
+                     executor: Optional[ThreadPoolExecutor] = None) -> List[Track]:
+        """Build tracks for files, reusing cached metadata where possible.
+
+        A cache entry is used when the file's mtime and size still match;
+        everything else is parsed with mutagen and written back in one
+        transaction (files that failed to parse are left out).
+
+        Args:
+            file_paths: Supported audio files
+            executor: Pool used for metadata extraction
+
+        Returns:
+            Track objects in the same order as file_paths
+        """
+        cache = cls._metadata_cache
+        if cache is None:
+            return [track for track, _ in cls._extract_all(file_paths, executor)]
+
+        cached = cache.get_file_metadata(file_paths)
+        tracks: List[Optional[Track]] = [None] * len(file_paths)
+        misses = []
+
+        for i, path in enumerate(file_paths):
+            try:
+                st = os.stat(path)
+                key = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                key = None
+
+            entry = cached.get(path)
+            if key is not None and entry is not None and entry[:2] == key:
+                metadata = entry[2]
+                tracks[i] = Track(
+                    file_path=path,
+                    **{name: metadata[name] for name in _CACHED_FIELDS if name in metadata}
+                )
+            else:
+                misses.append((i, path, key))
+
+        if misses:
+            extracted = cls._extract_all([path for _, path, _ in misses], executor)
+            updates = []
+            for (i, path, key), (track, ok) in zip(misses, extracted):
+                tracks[i] = track
+                # Failed reads are retried on the next scan, not cached
+                if ok and key is not None:
+                    metadata = {name: getattr(track, name) for name in _CACHED_FIELDS}
+                    updates.append((path, key[0], key[1], metadata))
+            if updates:
+                cache.save_file_metadata(updates)
+
+        # Every slot is filled by a cache hit or an extraction
+        return [track for track in tracks if track is not None]
+
+    @classmethod
+    async def scan_directory_iter(cls, directory: Path, recursive: bool = True) -> AsyncIterator[List[Track]]:
+        """Scan a directory, yielding tracks in batches as they are read.
+
+        The walk and tag parsing run on a worker thread, so the first
+        batch is available long before a large library finishes scanning.
+        Batches come in discovery order; they are neither sorted nor
+        enriched with Spotify metadata.
+
+        Args:
+            directory: Directory to scan
+            recursive: Whether to scan subdirectories recursively
+
+        Yields:
+            Lists of up to SCAN_BATCH_SIZE Track objects
+        """
+        if not directory.exists() or not directory.is_dir():
+            return
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        done = object()
+        stop = threading.Event()
+
+        def produce():
+            try:
+                with ThreadPoolExecutor(max_workers=cls.SCAN_WORKERS,
+                                        thread_name_prefix="muker-scan") as executor:
+                    batch: List[str] = []
+                    for path in cls._walk(str(directory), recursive):
+                        batch.append(path)
+                        if len(batch) >= cls.SCAN_BATCH_SIZE:
+                            if stop.is_set():
+                                return
+                            loop.call_soon_threadsafe(queue.put_nowait, cls._load_tracks(batch, executor))
+                            batch = []
+                    if batch and not stop.is_set():
+                        loop.call_soon_threadsafe(queue.put_nowait, cls._load_tracks(batch, executor))
+            finally:
+                loop.call_soon_threadsafe(queue.put_nowait, done)
+
+        producer = asyncio.ensure_future(asyncio.to_thread(produce))
+        try:
+            while True:
+                batch = await queue.get()
+                if batch is done:
+                    break
+                yield batch
+            # Surface errors raised by the scanning thread
+            await producer
+        finally:
+            # The consumer may stop early; let the thread wind down
+            stop.set()
 
     @classmethod
-    async def scan_directory(cls, directory: Path, recursive: bool = True, enrich_with_spotify: bool = False) -> List[Track]:
+    async def scan_directory(cls, directory: Path, recursive: bool = True, enrich_with_spotify: bool = False,
+                             on_batch: Optional[Callable[[List[Track]], None]] = None) -> List[Track]:
         """Scan a directory for music files.
 
         Args:
             directory: Directory to scan
             recursive: Whether to scan subdirectories recursively
             enrich_with_spotify: Whether to enrich metadata with Spotify
+            on_batch: Called with each batch of unsorted tracks as it is read
 
         Returns:
             List of Track objects
         """
         tracks: List[Track] = []
 
-        if not directory.exists() or not directory.is_dir():
-            return tracks
+        async for batch in cls.scan_directory_iter(directory, recursive):
+            tracks.extend(batch)
+            if on_batch is not None:
+                on_batch(batch)
 
-        # Use asyncio to scan files
-        def scan_sync():
-            found_tracks = []
-            pattern = '**/*' if recursive else '*'
+        # Spotify lookups are network-bound, so run them concurrently
+        if enrich_with_spotify and cls._spotify_service and cls._spotify_service.is_available():
+            tracks = await cls._enrich_tracks_with_spotify(tracks)
 
-            for file_path in directory.glob(pattern):
-                if file_path.is_file() and cls.is_supported(file_path):
-                    track = cls.extract_metadata(file_path, enrich_with_spotify=enrich_with_spotify)
-                    found_tracks.append(track)
+        # Sort by artist, then album, then track number
+        tracks.sort(key=cls._sort_key)
 
-            return found_tracks
+        return tracks
 
-        # Run in executor to avoid blocking
-        tracks = await asyncio.to_thread(scan_sync)
+    @staticmethod
+    def _sort_key(track: Track) -> tuple:
+        """Library sort key: artist, album, then track number.
 
-        # Sort by artist, then album, then track number
-        tracks.sort(key=lambda t: (
-            t.artist.lower(),
-            t.album.lower(),
-            t.track_number if t.track_number is not None else 9999
-        ))
+        list.sort computes this once per track and sorts the decorated
+        keys, so each string is lowered exactly once.
+        """
+        return (
+            (track.artist or '').lower(),
+            (track.album or '').lower(),
+            track.track_number if track.track_number is not None else 9999
+        )
 
-        return tracks
+    @classmethod
+    async def _enrich_tracks_with_spotify(cls, tracks: List[Track]) -> List[Track]:
+        """Enrich tracks with Spotify metadata, several requests at a time.
+
+        Args:
+            tracks: Tracks to enrich
+
+        Returns:
+            Enriched tracks in the original order
+        """
+        service: Any = cls._spotify_service
+        semaphore = asyncio.Semaphore(cls.SPOTIFY_CONCURRENCY)
+
+        async def enrich(track: Track) -> Track:
+            # Only tracks with artist and title can be matched
+            if track.artist == UNKNOWN_ARTIST or not track.title:
+                return track
+            async with semaphore:
+                enriched: Track = await service.enrich_track_async(track)
+                return enriched
+
+        return list(await asyncio.gather(*(enrich(track) for track in tracks)))
 
     @staticmethod
     async def scan_files(file_paths: List[Path]) -> List[Track]:
@@ -202,11 +462,10 @@ class FileScanner:
             List of Track objects
         """
         def scan_sync():
-            return [
-                FileScanner.extract_metadata(fp)
-                for fp in file_paths
+            return FileScanner._load_tracks([
+                str(fp) for fp in file_paths
                 if fp.is_file() and FileScanner.is_supported(fp)
-            ]
+            ])
 
         tracks = await asyncio.to_thread(scan_sync)
         return tracks
@@ -0,0 +1,102 @@
+"""Tests for audio utility functions."""
+
+import numpy as np
+from muker.utils.audio_utils import (
+    normalize_pcm_data, stereo_to_mono, calculate_rms, db_to_linear, linear_to_db,
+    format_time
+)
+
+
+def test_normalize_pcm_data():
+    """Test peak normalization."""
+    data = np.array([0.5, -2.0, 1.0], dtype=np.float32)
+    normalized = normalize_pcm_data(data)
+
+    np.testing.assert_allclose(normalized, [0.25, -1.0, 0.5])
+    # Input is left untouched
+    assert data[1] == -2.0
+
+
+def test_normalize_pcm_data_int16():
+    """Test normalizing int16 data containing the most negative value."""
+    data = np.array([-32768, 16384], dtype=np.int16)
+    normalized = normalize_pcm_data(data)
+
+    np.testing.assert_allclose(normalized, [-1.0, 0.5])
+
+
+def test_normalize_pcm_data_in_place():
+    """Test normalizing into a caller-provided buffer."""
+    data = np.array([1.0, -4.0, 2.0], dtype=np.float32)
+    result = normalize_pcm_data(data, out=data)
+
+    assert result is data
+    np.testing.assert_allclose(data, [0.25, -1.0, 0.5])
+
+
+def test_normalize_pcm_data_silence():
+    """Test that silence is returned unchanged."""
+    data = np.zeros(4, dtype=np.float32)
+    np.testing.assert_array_equal(normalize_pcm_data(data), data)
+
+
+def test_stereo_to_mono():
+    """Test stereo downmix."""
+    stereo = np.array([[32767, 32767], [-32768, 0]], dtype=np.int16)
+    mono = stereo_to_mono(stereo)
+
+    assert mono.dtype == np.float32
+    np.testing.assert_allclose(mono, [32767.0, -16384.0])
+
+    buffer = np.empty(2, dtype=np.float32)
+    assert stereo_to_mono(stereo, out=buffer) is buffer
+
+    mono_input = np.ones(3, dtype=np.float32)
+    assert stereo_to_mono(mono_input) is mono_input
+
+
+def test_calculate_rms():
+    """Test RMS calculation."""
+    assert calculate_rms(np.array([])) == 0.0
+    assert abs(calculate_rms(np.array([3.0, -3.0], dtype=np.float32)) - 3.0) < 1e-6
+    assert abs(calculate_rms(np.array([[1, -1], [1, -1]], dtype=np.int16)) - 1.0) < 1e-9
+    # Large int16 values must not overflow
+    assert abs(calculate_rms(np.full(1000, 32000, dtype=np.int16)) - 32000.0) < 1e-6
+
+
+def test_float32_kernels_match_numpy(monkeypatch):
+    """Test that the float32 fast paths agree with the NumPy fallback."""
+    from muker.utils import audio_utils
+
+    rng = np.random.default_rng(0)
+    stereo = rng.standard_normal((512, 2)).astype(np.float32)
+
+    mono = stereo_to_mono(stereo)
+    normalized = normalize_pcm_data(mono)
+    rms = calculate_rms(mono)
+
+    monkeypatch.setattr(audio_utils, "NUMBA_AVAILABLE", False)
+    np.testing.assert_allclose(stereo_to_mono(stereo), mono, rtol=1e-6)
+    np.testing.assert_allclose(normalize_pcm_data(mono), normalized, rtol=1e-6)
+    assert abs(calculate_rms(mono) - rms) < 1e-6
+
+
+def test_db_conversions():
+    """Test decibel/linear conversions."""
+    assert abs(db_to_linear(0.0) - 1.0) < 1e-12
+    assert abs(db_to_linear(20.0) - 10.0) < 1e-9
+    assert abs(linear_to_db(10.0) - 20.0) < 1e-9
+    assert linear_to_db(0.0) == -float('inf')
+
+    db = np.array([-20.0, 0.0, 6.0])
+    out = np.empty(3)
+    assert db_to_linear(db, out=out) is out
+    np.testing.assert_allclose(out, 10.0 ** (db / 20.0))
+
+
+def test_format_time():
+    """Test time formatting."""
+    assert format_time(0) == "00:00"
+    assert format_time(65.9) == "01:05"
+    assert format_time(3600) == "01:00:00"
+    assert format_time(3725.2) == "01:02:05"
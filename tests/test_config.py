@@ -0,0 +1,46 @@
+"""Tests for Config."""
+
+import asyncio
+import json
+
+from muker.utils.config import Config
+
+
+def test_config_roundtrip(tmp_path):
+    """Test that saved settings are loaded back."""
+    path = tmp_path / "config.json"
+    config = Config(path)
+    assert path.exists()
+    assert config.get('volume') == 0.7
+
+    config.set('volume', 0.25)
+    config.set('last_directory', 'Müsik')
+    config.save()
+
+    reloaded = Config(path)
+    assert reloaded.get('volume') == 0.25
+    assert reloaded.get('last_directory') == 'Müsik'
+    assert reloaded.get('autoplay') is False
+
+    # Only values that differ from the defaults are written
+    assert set(json.loads(path.read_text(encoding='utf-8'))) == {'volume', 'last_directory'}
+
+    reloaded.reset()
+    assert Config(path).get('volume') == 0.7
+
+
+def test_config_save_later_coalesces(tmp_path):
+    """Test that save_later writes once after a burst of changes."""
+    path = tmp_path / "config.json"
+    config = Config(path)
+    config.SAVE_DELAY = 0.01
+
+    async def burst():
+        for step in range(5):
+            config.set('volume', step / 10)
+            config.save_later()
+        assert Config(path).get('volume') == 0.7
+        await asyncio.sleep(0.05)
+
+    asyncio.run(burst())
+    assert Config(path).get('volume') == 0.4
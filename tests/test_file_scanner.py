@@ -0,0 +1,34 @@
+"""Tests for FileScanner."""
+
+from muker.utils.file_scanner import FileScanner
+
+
+class FakeMetadataCache:
+    """In-memory stand-in for the DatabaseManager metadata cache."""
+
+    def __init__(self):
+        self.entries = {}
+
+    def get_file_metadata(self, paths):
+        return {path: self.entries[path] for path in paths if path in self.entries}
+
+    def save_file_metadata(self, entries):
+        for path, mtime_ns, size, metadata in entries:
+            self.entries[path] = (mtime_ns, size, metadata)
+
+
+def test_failed_reads_are_not_cached(tmp_path, monkeypatch):
+    """Test that files whose tags could not be read are retried next scan."""
+    broken = tmp_path / "broken.flac"
+    broken.write_bytes(b"not really flac")
+    plain = tmp_path / "plain.xyz"
+    plain.write_bytes(b"unrecognized")
+
+    cache = FakeMetadataCache()
+    monkeypatch.setattr(FileScanner, "_metadata_cache", cache)
+
+    tracks = FileScanner._load_tracks([str(broken), str(plain)])
+
+    assert [track.title for track in tracks] == ["broken", "plain"]
+    assert str(broken) not in cache.entries
+    assert str(plain) in cache.entries
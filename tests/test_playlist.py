@@ -155,3 +155,44 @@ def test_get_track_count(sample_tracks):
 
     playlist.add_tracks(sample_tracks)
     assert playlist.get_track_count() == 3
+
+
+def test_track_changed_callback(sample_tracks):
+    """Test track change notifications."""
+    playlist = PlaylistManager()
+    changes = []
+    playlist.add_track_changed_callback(changes.append)
+
+    playlist.add_tracks(sample_tracks)
+    assert changes == [sample_tracks[0]]
+
+    playlist.next_track()
+    playlist.set_current_index(1)  # Same track, no notification
+    assert changes == [sample_tracks[0], sample_tracks[1]]
+
+    playlist.clear()
+    assert changes[-1] is None
+
+    playlist.remove_track_changed_callback(changes.append)
+    playlist.add_tracks(sample_tracks)
+    assert len(changes) == 3
+
+
+def test_replace_tracks_with_held_notifications(sample_tracks):
+    """Test a streamed fill notifies once and keeps the current track by path."""
+    playlist = PlaylistManager()
+    changes = []
+    playlist.add_track_changed_callback(changes.append)
+
+    with playlist.hold_notifications():
+        playlist.add_tracks(sample_tracks[2:])
+        playlist.add_tracks(sample_tracks[:2])
+        playlist.set_current_index(2)  # Track 2, picked while the list fills
+        assert changes == []
+
+        sorted_tracks = [Track(file_path=t.file_path, title=t.title) for t in sample_tracks]
+        playlist.replace_tracks(sorted_tracks, keep_path=playlist.get_current_track().file_path)
+
+    assert playlist.tracks == sorted_tracks
+    assert playlist.current_index == 1
+    assert changes == [sorted_tracks[1]]
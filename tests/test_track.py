@@ -99,3 +99,38 @@ def test_track_extension():
     )
 
     assert track.extension == ".mp3"
+
+
+def test_track_display_line():
+    """Test cached display line follows metadata changes."""
+    track = Track(
+        file_path="/path/to/song.mp3",
+        title="Test Song",
+        artist="Test Artist",
+        duration=125.0
+    )
+
+    assert track.display_line == "Test Artist - Test Song (02:05)"
+    assert track.display_line is track.display_line
+
+    track.artist = "New Artist"
+    track.duration = 0.0
+    assert track.display_line == "New Artist - Test Song"
+
+
+def test_track_uses_slots():
+    """Test tracks carry no per-instance __dict__."""
+    track = Track(file_path="/path/to/song.mp3", title="Test Song")
+
+    assert not hasattr(track, "__dict__")
+    with pytest.raises(AttributeError):
+        track.not_a_field = 1
+
+
+def test_track_interns_artist_and_album():
+    """Test equal artist/album strings share one object."""
+    first = Track.from_dict({'path': '/a.mp3', 'title': 'A', 'artist': ''.join(['Some ', 'Artist'])})
+    second = Track.from_dict({'path': '/b.mp3', 'title': 'B', 'artist': ''.join(['Some ', 'Artist'])})
+
+    assert first.artist is second.artist
+    assert Track(file_path="/c.mp3", title="C").album is first.album